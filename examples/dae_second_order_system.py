@@ -12,14 +12,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import sys
-import io
 from pycontroldae.core import Module, System, Simulator
 from pycontroldae.blocks import Step
 
 # Set UTF-8 encoding for output
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode MS']
 plt.rcParams['axes.unicode_minus'] = False
@@ -12,7 +12,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import sys
-import io
 from pycontroldae.core import Module, CompositeModule, System, Simulator, DataProbe
 from pycontroldae.blocks import Step
 import matplotlib
@@ -25,8 +24,8 @@ plt.rcParams['axes.unicode_minus'] = True
 plt.rcParams['font.size'] = 9.0
 # Set UTF-8 encoding for output
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 # 设置中文字体支持
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode MS']
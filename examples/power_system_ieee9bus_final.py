@@ -250,39 +250,45 @@ print()
 print("PART 2: 创建变压器模型")
 print("-" * 80)
 
-class Transformer(Module):
-    """升压变压器模型（简化）"""
+class TransformerBank(Module):
+    """升压变压器组模型（简化，3台变压器合并为一个模块）"""
     def __init__(self, name: str,
-                 turns_ratio: float = 1.0,
-                 X_leakage: float = 0.01):
+                 turns_ratios=(1.0, 1.0, 1.0),
+                 X_leakage=(0.01, 0.01, 0.01)):
 
         super().__init__(name)
 
-        self.add_input("V_primary", 1.0)
-        self.add_output("V_secondary", 1.0)
+        self.n = np.asarray(turns_ratios, dtype=np.float64)
+        self.X_l = np.asarray(X_leakage, dtype=np.float64)
+        if self.n.shape != self.X_l.shape:
+            raise ValueError(
+                f"turns_ratios {self.n.shape} and X_leakage {self.X_l.shape} must have the same length"
+            )
 
-        self.add_param("n", turns_ratio)
-        self.add_param("X_l", X_leakage)
         self.add_param("tau", 0.001)
 
-        self.add_equation(
-            "D(V_secondary) ~ (n * V_primary - V_secondary) / tau"
-        )
-
-        self.set_input("V_primary")
-        self.set_output("V_secondary")
+        # 每相: V_secondary_k = n_k * V_primary_k（快速一阶跟踪）
+        for k, (n_k, X_k) in enumerate(zip(self.n, self.X_l), start=1):
+            self.add_input(f"V_primary{k}", 1.0)
+            self.add_output(f"V_secondary{k}", 1.0)
+            self.add_param(f"n{k}", float(n_k))
+            self.add_param(f"X_l{k}", float(X_k))
+            self.add_equation(
+                f"D(V_secondary{k}) ~ (n{k} * V_primary{k} - V_secondary{k}) / tau"
+            )
 
+        self.set_input("V_primary1")
+        self.set_output("V_secondary1")
 
-print("[2.1] 创建3台升压变压器...")
 
-transformer1 = Transformer(name="T1", turns_ratio=1.05, X_leakage=0.0062)
-transformer1.build()
+print("[2.1] 创建升压变压器组（3台）...")
 
-transformer2 = Transformer(name="T2", turns_ratio=1.025, X_leakage=0.0086)
-transformer2.build()
-
-transformer3 = Transformer(name="T3", turns_ratio=1.03, X_leakage=0.0119)
-transformer3.build()
+tbank = TransformerBank(
+    name="tbank",
+    turns_ratios=[1.05, 1.025, 1.03],
+    X_leakage=[0.0062, 0.0086, 0.0119]
+)
+tbank.build()
 
 print("  T1: n=1.05, T2: n=1.025, T3: n=1.03")
 print("[OK] 变压器创建完成")
@@ -413,7 +419,7 @@ modules = [
     gen1, gen2, gen3,
     # avr1, avr2, avr3,  # 移除AVR，使用固定励磁
     efd1, efd2, efd3,    # 固定励磁电压
-    transformer1, transformer2, transformer3,
+    tbank,               # 3台变压器合并为一个模块
     pm1, pm2, pm3,
     vref1, vref2, vref3,
     load5, load6, load8,
@@ -428,7 +434,7 @@ system.connect(pm1.P_m >> gen1.P_m)
 system.connect(efd1.E_fd >> gen1.E_fd)  # 固定励磁
 # system.connect(gen1.V_terminal >> avr1.V_t)  # 移除AVR反馈
 # system.connect(vref1.V_ref >> avr1.V_ref)
-system.connect(gen1.V_terminal >> transformer1.V_primary)
+system.connect(gen1.V_terminal >> tbank.V_primary1)
 system.connect(fault.V_fault >> gen1.V_t)  # Gen1受故障影响
 
 # Gen2连接 - 正常运行，使用固定励磁
@@ -436,7 +442,7 @@ system.connect(pm2.P_m >> gen2.P_m)
 system.connect(efd2.E_fd >> gen2.E_fd)  # 固定励磁
 # system.connect(gen2.V_terminal >> avr2.V_t)
 # system.connect(vref2.V_ref >> avr2.V_ref)
-system.connect(gen2.V_terminal >> transformer2.V_primary)
+system.connect(gen2.V_terminal >> tbank.V_primary2)
 system.connect(normal_voltage.V_normal >> gen2.V_t)  # Gen2保持正常电压
 
 # Gen3连接 - 正常运行，使用固定励磁
@@ -444,7 +450,7 @@ system.connect(pm3.P_m >> gen3.P_m)
 system.connect(efd3.E_fd >> gen3.E_fd)  # 固定励磁
 # system.connect(gen3.V_terminal >> avr3.V_t)
 # system.connect(vref3.V_ref >> avr3.V_ref)
-system.connect(gen3.V_terminal >> transformer3.V_primary)
+system.connect(gen3.V_terminal >> tbank.V_primary3)
 system.connect(normal_voltage.V_normal >> gen3.V_t)  # Gen3保持正常电压
 
 print(f"[4.1] 系统组装完成：{len(modules)}个模块，{len(system.connections)}个连接")
@@ -501,7 +507,8 @@ try:
     result = simulator.run(
         t_span=(0.0, 45.0),
         dt=0.00001,
-        solver="Rodas5"
+        solver="Rodas5",
+        save_dtype=np.float32  # 求解仍为Float64，仅输出轨迹存为float32
     )
     print(f"[OK] 仿真完成: {result}")
     print()
@@ -593,9 +600,9 @@ axes[3].grid(True, alpha=0.3)
 axes[3].legend(loc='best')
 
 # 子图5: 变压器二次侧电压
-axes[4].plot(df['time'], df['T1.V_secondary'], 'b-', linewidth=2, label='T1 (n=1.05)')
-axes[4].plot(df['time'], df['T2.V_secondary'], 'r-', linewidth=2, label='T2 (n=1.025)')
-axes[4].plot(df['time'], df['T3.V_secondary'], 'g-', linewidth=2, label='T3 (n=1.03)')
+axes[4].plot(df['time'], df['tbank.V_secondary1'], 'b-', linewidth=2, label='T1 (n=1.05)')
+axes[4].plot(df['time'], df['tbank.V_secondary2'], 'r-', linewidth=2, label='T2 (n=1.025)')
+axes[4].plot(df['time'], df['tbank.V_secondary3'], 'g-', linewidth=2, label='T3 (n=1.03)')
 axes[4].axvline(x=30.0, color='k', linestyle='--', alpha=0.5)
 axes[4].axvline(x=30.1, color='gray', linestyle='--', alpha=0.5)
 axes[4].set_xlabel('时间 (s)', fontsize=11)
@@ -622,11 +629,30 @@ print("=" * 80)
 print()
 
 # 关键时间点分析
-idx_steady = (df["time"] - 29.99).abs().idxmin()  # 故障前稳态
-idx_before = (df["time"] - 29.99).abs().idxmin()
-idx_fault = (df["time"] - 30.05).abs().idxmin()
-idx_clear = (df["time"] - 30.1).abs().idxmin()
-idx_after = (df["time"] - 30.5).abs().idxmin()
+# 时间列单调递增，用二分查找代替整列 (t - T).abs().idxmin()
+t_arr = df["time"].to_numpy()
+
+
+def nearest_index(t_query):
+    """返回最接近 t_query 的行号（t_arr 单调递增）"""
+    i = int(np.searchsorted(t_arr, t_query))
+    if i >= len(t_arr):
+        return len(t_arr) - 1
+    if i > 0 and (t_query - t_arr[i - 1]) <= (t_arr[i] - t_query):
+        return i - 1
+    return i
+
+
+idx_before = nearest_index(29.99)  # 故障前稳态
+idx_fault = nearest_index(30.05)
+idx_clear = nearest_index(30.1)
+idx_after = nearest_index(30.5)
+
+# 各机组功角最大值及其出现时刻
+deg_cols = ['gen1_deg', 'gen2_deg', 'gen3_deg']
+deg_arr = df[deg_cols].to_numpy()
+idx_max = np.argmax(deg_arr, axis=0)
+deg_max = deg_arr[idx_max, np.arange(len(deg_cols))]
 
 print("功角变化分析:")
 print(f"  t=29.99s (故障前稳态):")
@@ -642,14 +668,14 @@ print(f"  t=30.5s (故障后):")
 print(f"    Gen1: {df.loc[idx_after, 'gen1_deg']:.2f}°  Gen2: {df.loc[idx_after, 'gen2_deg']:.2f}°  Gen3: {df.loc[idx_after, 'gen3_deg']:.2f}°")
 
 print(f"\n功角最大值:")
-print(f"  Gen1: {df['gen1_deg'].max():.2f}° (t={df.loc[df['gen1_deg'].idxmax(), 'time']:.2f}s)")
-print(f"  Gen2: {df['gen2_deg'].max():.2f}° (t={df.loc[df['gen2_deg'].idxmax(), 'time']:.2f}s)")
-print(f"  Gen3: {df['gen3_deg'].max():.2f}° (t={df.loc[df['gen3_deg'].idxmax(), 'time']:.2f}s)")
+print(f"  Gen1: {deg_max[0]:.2f}° (t={t_arr[idx_max[0]]:.2f}s)")
+print(f"  Gen2: {deg_max[1]:.2f}° (t={t_arr[idx_max[1]]:.2f}s)")
+print(f"  Gen3: {deg_max[2]:.2f}° (t={t_arr[idx_max[2]]:.2f}s)")
 
 print(f"\n功角增量 (故障前→最大值):")
-print(f"  Gen1: Δδ = {df['gen1_deg'].max() - df.loc[idx_before, 'gen1_deg']:.2f}°")
-print(f"  Gen2: Δδ = {df['gen2_deg'].max() - df.loc[idx_before, 'gen2_deg']:.2f}°")
-print(f"  Gen3: Δδ = {df['gen3_deg'].max() - df.loc[idx_before, 'gen3_deg']:.2f}°")
+print(f"  Gen1: Δδ = {deg_max[0] - deg_arr[idx_before, 0]:.2f}°")
+print(f"  Gen2: Δδ = {deg_max[1] - deg_arr[idx_before, 1]:.2f}°")
+print(f"  Gen3: Δδ = {deg_max[2] - deg_arr[idx_before, 2]:.2f}°")
 
 print(f"\n电磁功率变化:")
 print(f"  Gen1 (故障前): P_e = {df.loc[idx_before, 'gen1.P_e']:.3f} p.u.")
@@ -660,7 +686,7 @@ print(f"\n系统性能:")
 print(f"  最大角速度偏差: {max(df['gen1.omega'].max(), df['gen2.omega'].max(), df['gen3.omega'].max()):.4f} rad/s")
 print(f"  最小机端电压: {min(df['gen1.V_terminal'].min(), df['gen2.V_terminal'].min(), df['gen3.V_terminal'].min()):.3f} p.u.")
 
-max_angle = max(df['gen1_deg'].max(), df['gen2_deg'].max(), df['gen3_deg'].max())
+max_angle = deg_max.max()
 stable = "稳定" if max_angle < 120 else "失稳"
 print(f"  系统状态: {stable}")
 
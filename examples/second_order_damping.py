@@ -6,14 +6,13 @@ Demonstrates underdamped, critically damped, and overdamped system responses
 import numpy as np
 import matplotlib.pyplot as plt
 import sys
-import io
 from pycontroldae.blocks import StateSpace, Step
 from pycontroldae.core import System, Simulator
 
 # Set UTF-8 encoding for output
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 # 设置中文字体支持
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode MS']
@@ -1,76 +1,100 @@
 """
 绘制3机9节点系统仿真结果（从状态变量直接读取）
 """
+import os
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+# 图片分辨率（默认150 dpi，可通过PLOT_DPI覆盖）；设置PLOT_SHOW时弹出窗口
+DPI = int(os.environ.get('PLOT_DPI', '150'))
+PLOT_SHOW = bool(os.environ.get('PLOT_SHOW'))
+
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
 
-# 读取CSV数据
-df = pd.read_csv('ieee_9bus_fault_v2.csv')
+# 读取CSV数据（只读取绘图用到的列，float32精度足够绘图）
+cols = ['time',
+        'gen1.delta', 'gen2.delta', 'gen3.delta',
+        'gen1.omega', 'gen2.omega', 'gen3.omega',
+        'gen1.P_e', 'gen2.P_e', 'gen3.P_e',
+        'gen1.V_terminal', 'gen2.V_terminal', 'gen3.V_terminal']
+df = pd.read_csv(
+    'ieee_9bus_fault_v2.csv',
+    usecols=cols,
+    dtype={c: np.float32 for c in cols[1:]},
+    engine='c',
+    memory_map=True
+)
+
+# 将弧度转换为度（三列一次转换）
+df[['gen1_angle_deg', 'gen2_angle_deg', 'gen3_angle_deg']] = np.rad2deg(
+    df[['gen1.delta', 'gen2.delta', 'gen3.delta']].to_numpy()
+)
 
-# 将弧度转换为度
-df['gen1_angle_deg'] = df['gen1.delta'] * 180 / np.pi
-df['gen2_angle_deg'] = df['gen2.delta'] * 180 / np.pi
-df['gen3_angle_deg'] = df['gen3.delta'] * 180 / np.pi
+# 绘图用降采样数据：整体按步长抽取，故障窗口 [1.9, 2.2]s 保留全部采样点
+# （统计量仍基于完整数据 df 计算）
+stride = max(1, len(df) // 4000)
+t_all = df['time'].to_numpy()
+fault_lo, fault_hi = np.searchsorted(t_all, [1.9, 2.2])
+plot_idx = np.union1d(np.arange(0, len(df), stride), np.arange(fault_lo, fault_hi))
+if plot_idx[-1] != len(df) - 1:
+    plot_idx = np.append(plot_idx, len(df) - 1)
+dfp = df.iloc[plot_idx]
 
-fig, axes = plt.subplots(4, 1, figsize=(14, 12))
+fig, axes = plt.subplots(4, 1, figsize=(14, 12), sharex=True)
 fig.suptitle('IEEE 9节点系统短路故障仿真（带启动过程）\nIEEE 9-Bus System with Initialization',
              fontsize=14, fontweight='bold')
 
 # 子图1: 功角
-axes[0].plot(df['time'], df['gen1_angle_deg'], 'b-', linewidth=2, label='Gen1 (大型)')
-axes[0].plot(df['time'], df['gen2_angle_deg'], 'r-', linewidth=2, label='Gen2 (中型)')
-axes[0].plot(df['time'], df['gen3_angle_deg'], 'g-', linewidth=2, label='Gen3 (小型)')
-axes[0].axvline(x=2.0, color='k', linestyle='--', alpha=0.5, label='故障')
-axes[0].axvline(x=2.1, color='gray', linestyle='--', alpha=0.5, label='切除')
+axes[0].plot(dfp['time'], dfp['gen1_angle_deg'], 'b-', linewidth=2, label='Gen1 (大型)')
+axes[0].plot(dfp['time'], dfp['gen2_angle_deg'], 'r-', linewidth=2, label='Gen2 (中型)')
+axes[0].plot(dfp['time'], dfp['gen3_angle_deg'], 'g-', linewidth=2, label='Gen3 (小型)')
 axes[0].set_ylabel('功角 (度)', fontsize=11)
 axes[0].set_title('(a) 发电机功角对比', fontsize=11, fontweight='bold')
-axes[0].grid(True, alpha=0.3)
-axes[0].legend(loc='best')
 
 # 子图2: 角速度
-axes[1].plot(df['time'], df['gen1.omega'], 'b-', linewidth=2, label='Gen1')
-axes[1].plot(df['time'], df['gen2.omega'], 'r-', linewidth=2, label='Gen2')
-axes[1].plot(df['time'], df['gen3.omega'], 'g-', linewidth=2, label='Gen3')
-axes[1].axvline(x=2.0, color='k', linestyle='--', alpha=0.5)
-axes[1].axvline(x=2.1, color='gray', linestyle='--', alpha=0.5)
+axes[1].plot(dfp['time'], dfp['gen1.omega'], 'b-', linewidth=2, label='Gen1')
+axes[1].plot(dfp['time'], dfp['gen2.omega'], 'r-', linewidth=2, label='Gen2')
+axes[1].plot(dfp['time'], dfp['gen3.omega'], 'g-', linewidth=2, label='Gen3')
 axes[1].axhline(y=0, color='k', linestyle='-', alpha=0.3)
 axes[1].set_ylabel('角速度偏差 (rad/s)', fontsize=11)
 axes[1].set_title('(b) 发电机角速度偏差对比', fontsize=11, fontweight='bold')
-axes[1].grid(True, alpha=0.3)
-axes[1].legend(loc='best')
 
 # 子图3: 电磁功率
-axes[2].plot(df['time'], df['gen1.P_e'], 'b-', linewidth=2, label='Gen1 Pe')
-axes[2].plot(df['time'], df['gen2.P_e'], 'r-', linewidth=2, label='Gen2 Pe')
-axes[2].plot(df['time'], df['gen3.P_e'], 'g-', linewidth=2, label='Gen3 Pe')
+axes[2].plot(dfp['time'], dfp['gen1.P_e'], 'b-', linewidth=2, label='Gen1 Pe')
+axes[2].plot(dfp['time'], dfp['gen2.P_e'], 'r-', linewidth=2, label='Gen2 Pe')
+axes[2].plot(dfp['time'], dfp['gen3.P_e'], 'g-', linewidth=2, label='Gen3 Pe')
 axes[2].axhline(y=0.716, color='b', linestyle='--', alpha=0.5, linewidth=1, label='Gen1 Pm')
 axes[2].axhline(y=1.63, color='r', linestyle='--', alpha=0.5, linewidth=1, label='Gen2 Pm')
 axes[2].axhline(y=0.85, color='g', linestyle='--', alpha=0.5, linewidth=1, label='Gen3 Pm')
-axes[2].axvline(x=2.0, color='k', linestyle='--', alpha=0.5)
-axes[2].axvline(x=2.1, color='gray', linestyle='--', alpha=0.5)
 axes[2].set_ylabel('功率 (p.u.)', fontsize=11)
 axes[2].set_title('(c) 发电机电磁功率', fontsize=11, fontweight='bold')
-axes[2].grid(True, alpha=0.3)
-axes[2].legend(loc='best', ncol=2, fontsize=9)
 
 # 子图4: 机端电压
-axes[3].plot(df['time'], df['gen1.V_terminal'], 'b-', linewidth=2, label='Gen1 电压')
-axes[3].plot(df['time'], df['gen2.V_terminal'], 'r-', linewidth=2, label='Gen2 电压')
-axes[3].plot(df['time'], df['gen3.V_terminal'], 'g-', linewidth=2, label='Gen3 电压')
-axes[3].axvline(x=2.0, color='k', linestyle='--', alpha=0.5)
-axes[3].axvline(x=2.1, color='gray', linestyle='--', alpha=0.5)
-axes[3].set_xlabel('时间 (s)', fontsize=11)
+axes[3].plot(dfp['time'], dfp['gen1.V_terminal'], 'b-', linewidth=2, label='Gen1 电压')
+axes[3].plot(dfp['time'], dfp['gen2.V_terminal'], 'r-', linewidth=2, label='Gen2 电压')
+axes[3].plot(dfp['time'], dfp['gen3.V_terminal'], 'g-', linewidth=2, label='Gen3 电压')
 axes[3].set_ylabel('机端电压 (p.u.)', fontsize=11)
 axes[3].set_title('(d) 发电机机端电压', fontsize=11, fontweight='bold')
-axes[3].grid(True, alpha=0.3)
+
+# 公共设置：故障/切除标记与网格（图例标签只加在第一个子图上）
+for i, ax in enumerate(axes):
+    ax.axvline(x=2.0, color='k', linestyle='--', alpha=0.5, label='故障' if i == 0 else None)
+    ax.axvline(x=2.1, color='gray', linestyle='--', alpha=0.5, label='切除' if i == 0 else None)
+    ax.grid(True, alpha=0.3)
+
+axes[0].legend(loc='best')
+axes[1].legend(loc='best')
+axes[2].legend(loc='best', ncol=2, fontsize=9)
 axes[3].legend(loc='best')
 
+# x轴共享：只需设置一次范围，只在最下方子图标注
+axes[0].set_xlim(t_all[0], t_all[-1])
+axes[-1].set_xlabel('时间 (s)', fontsize=11)
+
 plt.tight_layout()
-plt.savefig('ieee_9bus_fault_v2_corrected.png', dpi=300, bbox_inches='tight')
+plt.savefig('ieee_9bus_fault_v2_corrected.png', dpi=DPI, bbox_inches='tight')
 
 print("=" * 80)
 print("重新绘制完成！")
@@ -88,4 +112,6 @@ print()
 print("图形已保存: ieee_9bus_fault_v2_corrected.png")
 print("=" * 80)
 
-plt.show()
+if PLOT_SHOW:
+    plt.show()
+plt.close(fig)
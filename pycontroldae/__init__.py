@@ -66,6 +66,9 @@ from .blocks import (
     # Basic control blocks
     Gain,
     Sum,
+    Subtract,
+    Add2,
+    VectorSum,
     PID,
     Integrator,
     Derivative,
@@ -107,6 +110,9 @@ __all__ = [
     # Basic control blocks
     'Gain',
     'Sum',
+    'Subtract',
+    'Add2',
+    'VectorSum',
     'PID',
     'Integrator',
     'Derivative',
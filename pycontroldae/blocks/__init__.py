@@ -13,6 +13,8 @@ Signal Sources (blocks.sources):
 Basic Control Blocks (blocks.basic):
     - Gain: Proportional amplifier
     - Sum: Summing junction (adder/subtractor)
+    - Subtract / Add2: Two-input Sum shorthands
+    - VectorSum: n Sum channels in one module
     - PID: PID controller
     - Integrator: Pure integrator
     - Derivative: Filtered derivative
@@ -47,6 +49,9 @@ from .sources import (
 from .basic import (
     Gain,
     Sum,
+    Subtract,
+    Add2,
+    VectorSum,
     PID,
     Integrator,
     Derivative,
@@ -75,6 +80,9 @@ __all__ = [
     # Basic control blocks
     'Gain',
     'Sum',
+    'Subtract',
+    'Add2',
+    'VectorSum',
     'PID',
     'Integrator',
     'Derivative',
@@ -4,6 +4,8 @@ Basic Control Modules for pycontroldae - REDESIGNED
 This module provides fundamental control system building blocks:
 - Gain: Proportional gain (amplifier)
 - Sum: Summing junction (adder/subtractor)
+- Subtract / Add2: Two-input Sum shorthands
+- VectorSum: n Sum channels in one module
 - PID: PID controller with standard form
 - Integrator: Pure integrator
 - Derivative: Derivative with filtering
@@ -21,6 +23,30 @@ from typing import Optional, List
 from ..core.module import Module
 
 
+def _signed_sum(names: List[str], signs: List[float]) -> str:
+    """
+    Build the expression sign1*name1 + sign2*name2 + ...
+
+    Unit signs become plain +/- terms so no multiplications by ±1 end up in
+    the symbolic expression (e.g. "input1 - input2").
+    """
+    expr = ""
+    for name, sign in zip(names, signs):
+        if sign == 1:
+            term = name
+        elif sign == -1:
+            term = f"-{name}"
+        else:
+            term = f"{sign} * {name}"
+        if not expr:
+            expr = term
+        elif term.startswith("-"):
+            expr += f" - {term[1:]}"
+        else:
+            expr += f" + {term}"
+    return expr
+
+
 class Gain(Module):
     """
     Proportional gain (amplifier) block.
@@ -136,11 +162,9 @@ class Sum(Module):
         self.add_parameter("tau", 1e-6)
 
         # Build the sum equation: output = sign1*input1 + sign2*input2 + ...
-        terms = [
-            f"{'+' if sign >= 0 else ''}{sign} * input{i+1}"
-            for i, sign in enumerate(self.signs)
-        ]
-        sum_expr = " + ".join(terms)
+        sum_expr = _signed_sum(
+            [f"input{i+1}" for i in range(num_inputs)], self.signs
+        )
 
         # Fast first-order tracking
         self.add_equation(f"D(output) ~ (({sum_expr}) - output) / tau")
@@ -167,6 +191,127 @@ class Sum(Module):
         return f"input{input_num}"
 
 
+class Subtract(Sum):
+    """
+    Two-input subtractor block: output = input1 - input2
+
+    Shorthand for Sum(num_inputs=2, signs=[+1, -1]), the usual error junction.
+
+    Example:
+        >>> error = Subtract(name="error")
+        >>> system.connect(setpoint.signal >> error.input1)
+        >>> system.connect(plant.y1 >> error.input2)
+    """
+
+    def __init__(self, name: str = "subtract"):
+        """
+        Initialize a Subtract block.
+
+        Args:
+            name: Name of the module
+        """
+        super().__init__(name, num_inputs=2, signs=[1, -1])
+
+
+class Add2(Sum):
+    """
+    Two-input adder block: output = input1 + input2
+
+    Shorthand for Sum(num_inputs=2, signs=[+1, +1]).
+
+    Example:
+        >>> ctrl_sum = Add2(name="ctrl_sum")
+        >>> system.connect(pid.output >> ctrl_sum.input1)
+        >>> system.connect(disturbance.signal >> ctrl_sum.input2)
+    """
+
+    def __init__(self, name: str = "add"):
+        """
+        Initialize an Add2 block.
+
+        Args:
+            name: Name of the module
+        """
+        super().__init__(name, num_inputs=2, signs=[1, 1])
+
+
+class VectorSum(Module):
+    """
+    Vector summing junction: n independent Sum channels in one module.
+
+    Channel i computes output{i} = Σ(sign_j * input{j}_{i}), with the same signs
+    for every channel. Using one VectorSum instead of n Sum blocks gives
+    structural_simplify one subsystem (sharing a single tau parameter) to
+    process instead of n.
+
+    Parameters:
+        - signs: List of signs for each input (+1 or -1), shared by all channels
+
+    Inputs:
+        - input1_1, input2_1, ..., input1_n, input2_n: Input signals (algebraic)
+
+    Output:
+        - output1, ..., outputn: Channel sums (algebraic)
+
+    Example:
+        >>> # Four error signals: setpoint_i - measurement_i
+        >>> errors = VectorSum(name="errors", n=4, signs=[+1, -1])
+        >>> system.connect("temp_sp.signal ~ errors.input1_1")
+        >>> system.connect("plant.y1 ~ errors.input2_1")
+        >>> system.connect("errors.output1 ~ pid.error")
+    """
+
+    def __init__(
+        self,
+        name: str = "vector_sum",
+        n: int = 2,
+        num_inputs: int = 2,
+        signs: Optional[List[int]] = None
+    ):
+        """
+        Initialize a VectorSum block.
+
+        Args:
+            name: Name of the module
+            n: Number of channels (default: 2)
+            num_inputs: Number of inputs per channel (default: 2)
+            signs: List of signs for each input (+1 or -1).
+                   If None, defaults to all +1
+        """
+        super().__init__(name, output_var="output1")
+
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}")
+
+        self.n = n
+        self.num_inputs = num_inputs
+
+        # Set signs (default to all positive)
+        if signs is None:
+            self.signs = [1] * num_inputs
+        else:
+            if len(signs) != num_inputs:
+                raise ValueError(
+                    f"Length of signs ({len(signs)}) must match num_inputs ({num_inputs})"
+                )
+            self.signs = signs
+
+        # Fast time constant
+        self.add_parameter("tau", 1e-6)
+
+        for i in range(1, n + 1):
+            # Inputs for channel i (all determined by connections)
+            inputs = [f"input{j}_{i}" for j in range(1, num_inputs + 1)]
+            for input_name in inputs:
+                self.add_state(input_name, 0.0)
+                # NO equation for inputs!
+
+            # Output of channel i with fast first-order tracking
+            self.add_state(f"output{i}", 0.0)
+            sum_expr = _signed_sum(inputs, self.signs)
+            self.add_equation(f"D(output{i}) ~ (({sum_expr}) - output{i}) / tau")
+
+
 class PID(Module):
     """
     PID Controller with standard form.
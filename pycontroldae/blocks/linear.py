@@ -19,11 +19,31 @@ Where:
 """
 
 import numpy as np
-from typing import Optional
+from typing import List, Optional
 from ..core.module import Module
 from ..core.backend import get_jl
 
 
+def _linear_terms(M: np.ndarray, names: List[str]) -> List[List[str]]:
+    """
+    Per-row "coef * name" terms of the product M @ names.
+
+    Near-zero coefficients are dropped with one vectorized mask; np.nonzero
+    returns indices in row-major order, so each row keeps its column order.
+
+    Args:
+        M: Coefficient matrix (rows x len(names))
+        names: Variable names multiplied by the columns of M
+
+    Returns:
+        List with one list of term strings per row of M
+    """
+    rows: List[List[str]] = [[] for _ in range(M.shape[0])]
+    for i, j in zip(*np.nonzero(np.abs(M) > 1e-15)):
+        rows[i].append(f"{float(M[i, j])} * {names[j]}")
+    return rows
+
+
 class StateSpace(Module):
     """
     State-space representation of a linear time-invariant (LTI) system.
@@ -92,11 +112,11 @@ class StateSpace(Module):
         if A is None or B is None or C is None or D is None:
             raise ValueError("A, B, C, D matrices must all be provided")
 
-        # Convert to numpy arrays
-        A = np.asarray(A, dtype=float)
-        B = np.asarray(B, dtype=float)
-        C = np.asarray(C, dtype=float)
-        D = np.asarray(D, dtype=float)
+        # Convert to contiguous float64 arrays
+        A = np.ascontiguousarray(A, dtype=np.float64)
+        B = np.ascontiguousarray(B, dtype=np.float64)
+        C = np.ascontiguousarray(C, dtype=np.float64)
+        D = np.ascontiguousarray(D, dtype=np.float64)
 
         # Get dimensions
         if A.ndim != 2 or A.shape[0] != A.shape[1]:
@@ -158,52 +178,26 @@ class StateSpace(Module):
         for i in range(p):
             self.add_state(f"y{i+1}", 0.0)
 
+        x_names = self.get_state_vector()
+        u_names = self.get_input_vector()
+
         # Build state equations: dx/dt = A*x + B*u
         # For each state i: D(x[i]) = sum_j(A[i,j]*x[j]) + sum_k(B[i,k]*u[k])
+        ax_rows = _linear_terms(A, x_names)
+        bu_rows = _linear_terms(B, u_names)
         for i in range(n):
-            # A*x terms
-            ax_terms = []
-            for j in range(n):
-                if abs(A[i, j]) > 1e-15:  # Skip near-zero terms
-                    ax_terms.append(f"{A[i,j]} * x{j+1}")
-
-            # B*u terms
-            bu_terms = []
-            for k in range(m):
-                if abs(B[i, k]) > 1e-15:  # Skip near-zero terms
-                    bu_terms.append(f"{B[i,k]} * u{k+1}")
-
-            # Combine terms
-            all_terms = ax_terms + bu_terms
-            if not all_terms:
-                # All zero, state doesn't change
-                rhs = "0"
-            else:
-                rhs = " + ".join(all_terms)
-
+            all_terms = ax_rows[i] + bu_rows[i]
+            # All zero: state doesn't change
+            rhs = " + ".join(all_terms) if all_terms else "0"
             self.add_equation(f"D(x{i+1}) ~ {rhs}")
 
         # Build output equations: y = C*x + D*u
         # For each output i: y[i] = sum_j(C[i,j]*x[j]) + sum_k(D[i,k]*u[k])
+        cx_rows = _linear_terms(C, x_names)
+        du_rows = _linear_terms(D, u_names)
         for i in range(p):
-            # C*x terms
-            cx_terms = []
-            for j in range(n):
-                if abs(C[i, j]) > 1e-15:
-                    cx_terms.append(f"{C[i,j]} * x{j+1}")
-
-            # D*u terms
-            du_terms = []
-            for k in range(m):
-                if abs(D[i, k]) > 1e-15:
-                    du_terms.append(f"{D[i,k]} * u{k+1}")
-
-            # Combine terms
-            all_terms = cx_terms + du_terms
-            if not all_terms:
-                rhs = "0"
-            else:
-                rhs = " + ".join(all_terms)
+            all_terms = cx_rows[i] + du_rows[i]
+            rhs = " + ".join(all_terms) if all_terms else "0"
 
             # Output follows the algebraic equation with fast dynamics
             self.add_parameter(f"tau_y{i+1}", 0.001)  # Fast response
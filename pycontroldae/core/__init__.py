@@ -4,7 +4,7 @@ Core modules for pycontroldae
 Exports the main classes for building and simulating control systems.
 """
 
-from .backend import JuliaBackend, get_jl
+from .backend import JuliaBackend, get_jl, is_defined
 from .module import Module
 from .port import Port, Connection
 from .composite import CompositeModule, create_composite
@@ -16,6 +16,7 @@ from .result import SimulationResult, DataProbe
 __all__ = [
     'JuliaBackend',
     'get_jl',
+    'is_defined',
     'Module',
     'Port',
     'Connection',
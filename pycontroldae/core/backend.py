@@ -21,6 +21,7 @@ class JuliaBackend:
 
     _instance: Optional['JuliaBackend'] = None
     _jl = None
+    _is_defined = None  # Compiled Julia predicate, see is_defined()
     _initialized = False
 
     def __new__(cls):
@@ -58,7 +59,7 @@ class JuliaBackend:
             print("This may take several minutes on first run...\n")
 
             jl.seval('import Pkg')
-            jl.seval('Pkg.add(["ModelingToolkit", "DifferentialEquations"])')
+            jl.seval('Pkg.add(["ModelingToolkit", "DifferentialEquations", "StaticArrays"])')
             print("[PASS] Required packages installed/verified\n")
 
             # Load ModelingToolkit.jl
@@ -76,6 +77,140 @@ class JuliaBackend:
             jl.seval("using ModelingToolkit: t_nounits as t, D_nounits as D")
             print("[PASS] Symbolic operators imported")
 
+            # PythonCall is used by event callbacks to call back into Python
+            jl.seval("import PythonCall")
+
+            # Generic event helpers; each event callback is a small closure over these
+            jl.seval("""
+            function _apply_event_updates!(integrator, py_affect, event_params)
+                # Call the Python affect function to get parameter updates;
+                # None or an empty dict means nothing to change
+                py_updates = py_affect(integrator)
+                PythonCall.pytruth(py_updates) || return nothing
+                # Concrete key/value types keep the loop below type-stable, so each
+                # write is a String lookup plus one Float64 store into the parameters
+                param_updates = PythonCall.pyconvert(Dict{String, Float64}, py_updates)
+
+                for (param_name, new_value) in param_updates
+                    # Resolve (once) the setter for the Python name (e.g., "module.param");
+                    # names that are not parameters of the system map to nothing
+                    setter = get!(event_params.setters, param_name) do
+                        param_sym = get(event_params.symbols, param_name, nothing)
+                        param_sym === nothing ? nothing :
+                            ModelingToolkit.SymbolicIndexingInterface.setp(integrator, param_sym)
+                    end
+
+                    if setter === nothing
+                        @warn "Failed to update parameter $param_name: not a parameter of the system"
+                    else
+                        setter(integrator, new_value)
+                    end
+                end
+            end
+            """)
+            jl.seval("""
+            function _param_updates_affect(sys, param_updates, event_params)
+                # Resolve fixed parameter changes once, when the callback is built:
+                # the returned affect! writes all values with one indexed setter
+                names = String[]
+                for name in keys(param_updates)
+                    if haskey(event_params.symbols, name)
+                        push!(names, name)
+                    else
+                        @warn "Failed to update parameter $name: not a parameter of the system"
+                    end
+                end
+                isempty(names) && return integrator -> nothing
+                setter = ModelingToolkit.SymbolicIndexingInterface.setp(
+                    sys, [event_params.symbols[name] for name in names])
+                values = Float64[param_updates[name] for name in names]
+                return integrator -> setter(integrator, values)
+            end
+            """)
+            jl.seval("""
+            _eval_py_condition(py_condition, u, t, integrator) =
+                PythonCall.pyconvert(Float64, py_condition(u, t, integrator))
+            """)
+            jl.seval("""
+            _py_condition(py_condition) =
+                (u, t, integrator) -> _eval_py_condition(py_condition, u, t, integrator)
+            """)
+            jl.seval("""
+            _py_affect(py_affect, event_params) =
+                integrator -> _apply_event_updates!(integrator, py_affect, event_params)
+            """)
+            jl.seval("""
+            function _continuous_callback(condition, affect!, direction, save)
+                # affect! fires on upcrossings and affect_neg! on downcrossings;
+                # nothing disables that side (direction +1: up only, -1: down only)
+                ContinuousCallback(condition,
+                    direction == -1 ? nothing : affect!,
+                    direction == 1 ? nothing : affect!;
+                    save_positions=(save, save))
+            end
+            """)
+
+            # Solver choice for Simulator.run(solver="auto"): mass-matrix (DAE)
+            # problems need an implicit method; plain ODEs start explicit and
+            # switch to Rodas5P only if stiffness is detected
+            jl.seval("""
+            _auto_solver(prob) = prob.f.mass_matrix isa UniformScaling ?
+                AutoTsit5(Rodas5P()) : Rodas5P()
+            """)
+
+            # Copy a solution into a caller-provided (n_times, n_states) buffer
+            # (Simulator.run(out=...)); out is the NumPy array wrapped without a copy
+            jl.seval("""
+            function _copy_solution!(out, sol)
+                n_times = length(sol.u)
+                n_states = n_times > 0 ? length(sol.u[1]) : size(out, 2)
+                size(out) == (n_times, n_states) || throw(DimensionMismatch(
+                    "out has shape $(size(out)), the solution needs ($n_times, $n_states)"))
+                for (i, u) in enumerate(sol.u)
+                    @views out[i, :] .= u
+                end
+                return nothing
+            end
+            """)
+
+            # Parameter sweeps (Simulator.run_batch): row i of P holds the values
+            # of the parameters named in names for trajectory i
+            jl.seval("""
+            function _solve_ensemble(prob, params, names, P, alg, ensemble_alg; kwargs...)
+                lookup = Dict(ModelingToolkit.getname(p) => p for p in params)
+                cols = [i for (i, name) in enumerate(names) if haskey(lookup, name)]
+                syms = [lookup[names[i]] for i in cols]
+                prob_func = (prob, i, repeat) -> remake(prob; p=Dict(zip(syms, P[i, cols])))
+                ensemble = EnsembleProblem(prob; prob_func=prob_func, safetycopy=false)
+                sol = solve(ensemble, alg, ensemble_alg; trajectories=size(P, 1), kwargs...)
+
+                # One (n_trajectories, n_times, n_states) array for Python; the
+                # batch callbacks do not save extra points, so all grids match
+                times = sol.u[1].t
+                all(traj.t == times for traj in sol.u) || error(
+                    "trajectories were saved at different time points; " *
+                    "events must not save extra points in a batch")
+                out = Array{Float64}(undef, length(sol.u), length(times), length(prob.u0))
+                for (k, traj) in enumerate(sol.u), (j, u) in enumerate(traj.u)
+                    @views out[k, j, :] .= u
+                end
+                return times, out
+            end
+            """)
+
+            # SVector states for small systems (Simulator.run(static_arrays=True))
+            jl.seval("using StaticArrays: SVector")
+
+            # On-disk cache of simplified systems (System.compile(cache_dir=...))
+            jl.seval("import Serialization")
+
+            # Session cache of simplified systems (System.compile(use_cache=True))
+            jl.seval("_compile_cache = Dict{String, Any}()")
+
+            # Introspection helper compiled once, so checks are plain function
+            # calls instead of parsing and lowering a new expression each time
+            JuliaBackend._is_defined = jl.seval("name -> isdefined(Main, Symbol(name))")
+
             print("\n" + "="*60)
             print("Julia backend initialization complete!")
             print("="*60 + "\n")
@@ -116,3 +251,21 @@ def get_jl():
     """
     backend = JuliaBackend()
     return backend.jl
+
+
+def is_defined(name: str) -> bool:
+    """
+    Check whether a name is defined in the Julia Main module.
+
+    Args:
+        name: Julia name, e.g. "ModelingToolkit" or "_simplified_my_system"
+
+    Returns:
+        True if the name is defined in Main
+
+    Example:
+        >>> is_defined("ModelingToolkit")
+        True
+    """
+    JuliaBackend()
+    return bool(JuliaBackend._is_defined(name))
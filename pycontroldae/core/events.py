@@ -8,7 +8,7 @@ Provides event handling capabilities for simulations:
 Events allow dynamic modification of simulation parameters during execution.
 """
 
-from typing import Callable, Optional, Any, Dict
+from typing import Callable, Optional, Any, Dict, Union
 import inspect
 
 
@@ -27,6 +27,9 @@ class TimeEvent:
         callback: Python function that modifies parameters
                   Signature: callback(integrator) -> Dict[str, float]
                   Should return a dictionary of parameter changes
+                  (None or {} when nothing changes; no update is made)
+                  Alternatively the dictionary of parameter changes itself,
+                  which is applied natively in Julia without calling Python
 
     Example:
         >>> def change_gain(integrator):
@@ -34,9 +37,16 @@ class TimeEvent:
         >>>
         >>> event = TimeEvent(time=2.0, callback=change_gain)
         >>> system.add_event(event)
+        >>>
+        >>> # Fixed parameter changes, applied without a Python call
+        >>> event = TimeEvent(time=2.0, callback={"controller.Kp": 5.0})
     """
 
-    def __init__(self, time: float, callback: Callable[[Any], Dict[str, float]]):
+    def __init__(
+        self,
+        time: float,
+        callback: Union[Dict[str, float], Callable[[Any], Dict[str, float]]]
+    ):
         """
         Initialize a TimeEvent.
 
@@ -44,6 +54,7 @@ class TimeEvent:
             time: Time point at which to trigger the event
             callback: Function that returns parameter changes
                      Takes integrator as argument, returns dict {param_name: new_value}
+                     A dict {param_name: new_value} may be given directly
         """
         if time < 0:
             raise ValueError(f"Event time must be non-negative, got {time}")
@@ -52,7 +63,7 @@ class TimeEvent:
         self.callback = callback
 
     def __repr__(self) -> str:
-        return f"TimeEvent(time={self.time}, callback={self.callback.__name__})"
+        return f"TimeEvent(time={self.time}, callback={_describe(self.callback)})"
 
 
 class ContinuousEvent:
@@ -69,9 +80,21 @@ class ContinuousEvent:
         condition: Function that computes a scalar value
                    Signature: condition(u, t, integrator) -> float
                    Event triggers when this crosses zero
+                   Alternatively a string holding a Julia expression, e.g.
+                   "tank.level - 2.0". State names are replaced by the
+                   corresponding entries of u and the expression is compiled
+                   into a native Julia condition, so no Python call is made
+                   while the solver searches for the crossing. Only states of
+                   the simplified system can be named; observed variables are
+                   rejected. The expression may also use u, t and integrator
+                   directly.
         affect: Function that modifies parameters when event triggers
                 Signature: affect(integrator) -> Dict[str, float]
                 Should return a dictionary of parameter changes
+                (None or {} when nothing changes; no update is made)
+                Alternatively the dictionary of parameter changes itself;
+                together with a string condition the event then runs
+                entirely in Julia
         direction: Which zero-crossing to detect:
                    0 = both directions (default)
                    +1 = only positive-going (- to +)
@@ -91,21 +114,28 @@ class ContinuousEvent:
         ...     direction=1  # Only trigger on upward crossing
         ... )
         >>> system.add_event(event)
+        >>>
+        >>> # Same condition as a native Julia expression
+        >>> event = ContinuousEvent("plant.x1 - 1.0", saturate_input, direction=1)
+        >>>
+        >>> # Fully native event: string condition and fixed parameter changes
+        >>> event = ContinuousEvent("plant.x1 - 1.0", {"plant.input_limit": 0.5}, direction=1)
     """
 
     def __init__(
         self,
-        condition: Callable[[Any, float, Any], float],
-        affect: Callable[[Any], Dict[str, float]],
+        condition: Union[str, Callable[[Any, float, Any], float]],
+        affect: Union[Dict[str, float], Callable[[Any], Dict[str, float]]],
         direction: int = 0
     ):
         """
         Initialize a ContinuousEvent.
 
         Args:
-            condition: Function (u, t, integrator) -> float
-                      Event triggers when return value crosses zero
-            affect: Function (integrator) -> dict
+            condition: Function (u, t, integrator) -> float, or a Julia
+                      expression string in terms of state names, u, t
+                      Event triggers when its value crosses zero
+            affect: Function (integrator) -> dict, or a dict
                    Returns parameter changes when event triggers
             direction: Zero-crossing direction to detect:
                       0 = both, +1 = positive-going, -1 = negative-going
@@ -118,31 +148,50 @@ class ContinuousEvent:
         self.direction = direction
 
         # Validate function signatures
-        condition_sig = inspect.signature(condition)
-        if len(condition_sig.parameters) != 3:
-            raise ValueError(
-                f"condition function must take 3 arguments (u, t, integrator), "
-                f"got {len(condition_sig.parameters)}"
-            )
-
-        affect_sig = inspect.signature(affect)
-        if len(affect_sig.parameters) != 1:
-            raise ValueError(
-                f"affect function must take 1 argument (integrator), "
-                f"got {len(affect_sig.parameters)}"
-            )
+        if isinstance(condition, str):
+            if not condition.strip():
+                raise ValueError("condition expression must not be empty")
+        else:
+            condition_sig = inspect.signature(condition)
+            if len(condition_sig.parameters) != 3:
+                raise ValueError(
+                    f"condition function must take 3 arguments (u, t, integrator), "
+                    f"got {len(condition_sig.parameters)}"
+                )
+
+        if not isinstance(affect, dict):
+            affect_sig = inspect.signature(affect)
+            if len(affect_sig.parameters) != 1:
+                raise ValueError(
+                    f"affect function must take 1 argument (integrator), "
+                    f"got {len(affect_sig.parameters)}"
+                )
 
     def __repr__(self) -> str:
         dir_str = {-1: "negative", 0: "both", 1: "positive"}[self.direction]
+        if isinstance(self.condition, str):
+            condition_str = repr(self.condition)
+        else:
+            condition_str = self.condition.__name__
         return (
-            f"ContinuousEvent(condition={self.condition.__name__}, "
-            f"affect={self.affect.__name__}, direction={dir_str})"
+            f"ContinuousEvent(condition={condition_str}, "
+            f"affect={_describe(self.affect)}, direction={dir_str})"
         )
 
 
+def _describe(action: Union[Dict[str, float], Callable]) -> str:
+    """Short description of an event callback for __repr__."""
+    if isinstance(action, dict):
+        return repr(action)
+    return action.__name__
+
+
 # Convenience functions for creating events
 
-def at_time(time: float, callback: Callable[[Any], Dict[str, float]]) -> TimeEvent:
+def at_time(
+    time: float,
+    callback: Union[Dict[str, float], Callable[[Any], Dict[str, float]]]
+) -> TimeEvent:
     """
     Create a time-based event.
 
@@ -150,7 +199,7 @@ def at_time(time: float, callback: Callable[[Any], Dict[str, float]]) -> TimeEve
 
     Args:
         time: Time point at which to trigger
-        callback: Function returning parameter changes
+        callback: Function returning parameter changes, or the dict of changes
 
     Returns:
         TimeEvent instance
@@ -166,8 +215,8 @@ def at_time(time: float, callback: Callable[[Any], Dict[str, float]]) -> TimeEve
 
 
 def when_condition(
-    condition: Callable[[Any, float, Any], float],
-    affect: Callable[[Any], Dict[str, float]],
+    condition: Union[str, Callable[[Any, float, Any], float]],
+    affect: Union[Dict[str, float], Callable[[Any], Dict[str, float]]],
     direction: int = 0
 ) -> ContinuousEvent:
     """
@@ -176,8 +225,8 @@ def when_condition(
     Convenience function for creating ContinuousEvent objects.
 
     Args:
-        condition: Function (u, t, integrator) -> float
-        affect: Function (integrator) -> dict
+        condition: Function (u, t, integrator) -> float, or Julia expression string
+        affect: Function (integrator) -> dict, or the dict of changes
         direction: Zero-crossing direction (-1, 0, or 1)
 
     Returns:
@@ -7,6 +7,12 @@ import re
 import numpy as np
 from typing import Dict, List, Tuple, Any
 
+# Identifiers (word boundaries around alphanumeric + underscore names)
+_IDENTIFIER_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b')
+
+# Dotted names such as "plant.k" or "pid.int.x"
+_DOTTED_NAME_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_.]*)\b')
+
 
 class ObservedExpressionEvaluator:
     """
@@ -36,9 +42,7 @@ class ObservedExpressionEvaluator:
     def _extract_variables(self) -> List[str]:
         """Extract variable names from expression."""
         # Find all potential variable names (alphanumeric + underscore)
-        # Match pattern: word boundaries around identifiers
-        pattern = r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b'
-        matches = re.findall(pattern, self.expression)
+        matches = _IDENTIFIER_RE.findall(self.expression)
 
         # Filter out Python keywords and math functions
         keywords = {'and', 'or', 'not', 'in', 'is', 'if', 'else',
@@ -87,8 +91,7 @@ class ObservedExpressionEvaluator:
         name_mapping = {}
 
         # First pass: collect all dotted names
-        dotted_pattern = r'\b([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_.]*)\b'
-        for match in re.finditer(dotted_pattern, expr):
+        for match in _DOTTED_NAME_RE.finditer(expr):
             dotted_name = match.group(1)
             safe_name = dotted_name.replace('.', '_')
             name_mapping[dotted_name] = safe_name
@@ -45,6 +45,12 @@ class Module:
         >>> # or equivalently: rc << input_module
     """
 
+    # Julia ODESystems built so far, keyed by (states, parameters, equations).
+    # Numeric defaults are not part of the Julia system and the name is applied
+    # per instance with ModelingToolkit.rename, so modules that differ only in
+    # name or values (e.g. the PIDs of every control station) share one build.
+    _template_cache: Dict[Tuple, Tuple[Any, Any, Any]] = {}
+
     def __init__(self, name: str, input_var: Optional[str] = None, output_var: Optional[str] = None):
         """
         Initialize a new Module.
@@ -92,7 +98,8 @@ class Module:
             >>> module.add_state("position", 0.0)
             >>> module.add_state("velocity", 1.5)
         """
-        self._states[name] = default
+        # Stored as float64 so Julia never sees an Int default
+        self._states[name] = float(default)
         # Auto-create port for state variables
         self._create_port(name, is_input=True)  # States can be inputs
         return self
@@ -116,7 +123,8 @@ class Module:
             >>> module.add_param("mass", 1.0)
             >>> module.add_param("damping", 0.1)
         """
-        self._params[name] = default
+        # Stored as float64 so Julia never sees an Int default
+        self._params[name] = float(default)
         return self
 
     def add_parameter(self, name: str, default: float) -> 'Module':
@@ -283,55 +291,68 @@ class Module:
         jl = get_jl()
 
         try:
+            state_names = list(self._states.keys())
+            param_names = list(self._params.keys())
+            template_key = (tuple(state_names), tuple(param_names), tuple(self._equations))
+            cached = Module._template_cache.get(template_key)
+            if cached is not None:
+                # Same structure was built before: copy it under this module's name
+                template, state_syms, param_syms = cached
+                julia_system = jl.seval("ModelingToolkit.rename")(template, jl.Symbol(self.name))
+                setattr(jl, self.name, julia_system)
+                self._julia_state_symbols.update(zip(state_names, state_syms))
+                self._julia_param_symbols.update(zip(param_names, param_syms))
+                self._julia_system = julia_system
+                self._finalize_default_ports()
+                return self._julia_system
+
+            # All declarations go to Julia in a single block (one seval per
+            # module instead of one per state/parameter)
+            lines = []
+
             # Create symbolic state variables
             # Format: @variables x(t) y(t) z(t)
-            state_names = list(self._states.keys())
             states_decl = " ".join([f"{name}(t)" for name in state_names])
-            jl.seval(f"@variables {states_decl}")
-
-            # Store Julia state symbol references
-            # After @variables x(t), the symbol is stored as 'x' with (t) being implicit
-            # We store references to the base symbols for later use
-            for state_name in state_names:
-                # Access the variable directly by name (without (t))
-                # But we need to store it as a callable that can be used in equations
-                # Store the SymbolicUtils variable object
-                jl.seval(f"_sym_{state_name}_{self.name} = {state_name}")
-                self._julia_state_symbols[state_name] = jl.seval(
-                    f"_sym_{state_name}_{self.name}"
-                )
+            lines.append(f"@variables {states_decl}")
 
             # Create parameters
             # Format: @parameters R C L
-            if self._params:
-                param_names = list(self._params.keys())
-                params_decl = " ".join(param_names)
-                jl.seval(f"@parameters {params_decl}")
-
-                # Store Julia parameter symbol references
-                for param_name in param_names:
-                    jl.seval(f"_sym_{param_name}_{self.name} = {param_name}")
-                    self._julia_param_symbols[param_name] = jl.seval(
-                        f"_sym_{param_name}_{self.name}"
-                    )
+            if param_names:
+                lines.append(f"@parameters {' '.join(param_names)}")
+
+            # Keep module-qualified references to the Julia symbols
+            # (after @variables x(t), the symbol is stored as 'x')
+            for name in state_names + param_names:
+                lines.append(f"_sym_{name}_{self.name} = {name}")
 
             # Build equations array
             # Format: eqs = [D(x) ~ -a*x, D(y) ~ x - y]
             equations_str = ", ".join(self._equations)
-            jl.seval(f"_eqs_{self.name} = [{equations_str}]")
+            lines.append(f"_eqs_{self.name} = [{equations_str}]")
 
             # Create ODESystem
             # Format: @named system_name = ODESystem(eqs, t)
-            jl.seval(f"@named {self.name} = ODESystem(_eqs_{self.name}, t)")
+            lines.append(f"@named {self.name} = ODESystem(_eqs_{self.name}, t)")
+
+            # Return the system together with the symbol references
+            state_tuple = "".join(f"{name}, " for name in state_names)
+            param_tuple = "".join(f"{name}, " for name in param_names)
+            lines.append(f"({self.name}, ({state_tuple}), ({param_tuple}))")
+
+            julia_system, state_syms, param_syms = jl.seval(
+                "begin\n" + "\n".join(lines) + "\nend"
+            )
+            state_syms, param_syms = tuple(state_syms), tuple(param_syms)
+            Module._template_cache[template_key] = (julia_system, state_syms, param_syms)
+
+            # Store Julia symbol references for get_param_map()
+            self._julia_state_symbols.update(zip(state_names, state_syms))
+            self._julia_param_symbols.update(zip(param_names, param_syms))
 
             # Get the Julia system object
-            self._julia_system = jl.seval(self.name)
+            self._julia_system = julia_system
 
-            # Finalize default input/output ports
-            if self._default_input_name and self._default_input_name in self._ports:
-                self._input_var = self._ports[self._default_input_name]
-            if self._default_output_name and self._default_output_name in self._ports:
-                self._output_var = self._ports[self._default_output_name]
+            self._finalize_default_ports()
 
             return self._julia_system
 
@@ -340,6 +361,13 @@ class Module:
                 f"Failed to build Julia ODESystem for module '{self.name}': {e}"
             ) from e
 
+    def _finalize_default_ports(self) -> None:
+        """Resolve the default input/output ports named in the constructor."""
+        if self._default_input_name and self._default_input_name in self._ports:
+            self._input_var = self._ports[self._default_input_name]
+        if self._default_output_name and self._default_output_name in self._ports:
+            self._output_var = self._ports[self._default_output_name]
+
     def get_param_map(self) -> Dict[str, float]:
         """
         Get a mapping of parameter names to their Python default values.
@@ -427,7 +455,7 @@ class Module:
         if name not in self._params:
             raise KeyError(f"Parameter '{name}' does not exist in module '{self.name}'")
 
-        self._params[name] = value
+        self._params[name] = float(value)
         return self
 
     def update_state(self, name: str, value: float) -> 'Module':
@@ -453,7 +481,7 @@ class Module:
         if name not in self._states:
             raise KeyError(f"State '{name}' does not exist in module '{self.name}'")
 
-        self._states[name] = value
+        self._states[name] = float(value)
         return self
 
     def __lshift__(self, other: Union['Module', Port]) -> Connection:
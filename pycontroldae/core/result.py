@@ -7,7 +7,7 @@ Provides rich data structures for accessing and exporting simulation results:
 
 Features:
 - Flexible variable selection (states, outputs, parameters)
-- Multiple export formats (DataFrame, CSV, NumPy)
+- Multiple export formats (DataFrame, CSV, NumPy, .npz)
 - Time-series data access
 - Statistical summaries
 """
@@ -16,6 +16,9 @@ import numpy as np
 from typing import Optional, List, Dict, Union, Any
 from pathlib import Path
 
+# File suffixes pandas.to_csv() compresses by default (compression='infer')
+_COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.zip', '.xz', '.zst', '.tar')
+
 
 class DataProbe:
     """
@@ -87,6 +90,7 @@ class SimulationResult:
     - to_numpy(): Get raw NumPy arrays
     - to_dataframe(): Get pandas DataFrame (requires pandas)
     - to_csv(): Export to CSV file
+    - to_npz(): Export to binary NumPy archive
     - to_dict(): Get Python dictionary
 
     Also provides statistical summaries and time-series slicing.
@@ -137,6 +141,12 @@ class SimulationResult:
         self.solver = solver
         self.metadata = metadata or {}
 
+        # Column lookup for get_state()/get_states()
+        self._state_index = {name: i for i, name in enumerate(state_names)}
+
+        # Column names and data for tabular exports, built on first use
+        self._tables: Dict[bool, tuple] = {}
+
         # Validate dimensions
         if len(times) != values.shape[0]:
             raise ValueError(
@@ -196,9 +206,8 @@ class SimulationResult:
             }
         }
 
-        # Add state data
-        for i, name in enumerate(self.state_names):
-            result_dict[name] = self.values[:, i].tolist()
+        # Add state data (one tolist() call converts every column)
+        result_dict.update(zip(self.state_names, self.values.T.tolist()))
 
         # Add probe data if requested
         if include_probes and self.probe_data:
@@ -211,12 +220,18 @@ class SimulationResult:
 
         return result_dict
 
-    def to_dataframe(self, include_probes: bool = False):
+    def to_dataframe(self, include_probes: bool = False, copy: bool = True):
         """
         Export results as a pandas DataFrame.
 
+        The state (and probe) columns come from one cached contiguous 2D
+        array, so pandas stores them as a single block.
+
         Args:
             include_probes: Whether to include probe columns
+            copy: Copy the data into the DataFrame (default). With copy=False
+                the DataFrame wraps the cached read-only array without
+                copying; use it for read-only analysis of large results.
 
         Returns:
             pandas DataFrame with time as index
@@ -236,25 +251,43 @@ class SimulationResult:
                 "Install with: pip install pandas"
             )
 
-        # Create base dataframe with time and states
-        data = {'time': self.times}
-        for i, name in enumerate(self.state_names):
-            data[name] = self.values[:, i]
+        columns, data = self._table(include_probes)
+        df = pd.DataFrame(data, columns=columns, copy=copy)
+        df.insert(0, 'time', self.times)
 
-        df = pd.DataFrame(data)
+        return df
 
-        # Add probe data if requested
-        if include_probes and self.probe_data:
-            for probe_name, probe_vars in self.probe_data.items():
-                for var_name, var_values in probe_vars.items():
-                    # Use probe_name as prefix if multiple probes
-                    if len(self.probe_data) > 1:
-                        col_name = f"{probe_name}.{var_name}"
-                    else:
-                        col_name = var_name
-                    df[col_name] = var_values
+    def _table(self, include_probes: bool) -> tuple:
+        """
+        Column names and one contiguous 2D array of state (and probe) data.
 
-        return df
+        The column list and the stacked array are assembled once per
+        include_probes setting and reused by later to_dataframe() and
+        get_probe_dataframe() calls. The time column is kept separate so a
+        float32 result is not promoted to float64.
+
+        Args:
+            include_probes: Whether to append probe columns after the states
+
+        Returns:
+            Tuple of (column names, array of shape [n_times, n_columns])
+        """
+        key = bool(include_probes and self.probe_data)
+        if key not in self._tables:
+            columns = list(self.state_names)
+            blocks = [self.values]
+            if key:
+                # Use probe_name as prefix if multiple probes
+                multi = len(self.probe_data) > 1
+                for probe_name, probe_vars in self.probe_data.items():
+                    for var_name, var_values in probe_vars.items():
+                        columns.append(f"{probe_name}.{var_name}" if multi else var_name)
+                        blocks.append(var_values[:, None])
+            # hstack always allocates, so freezing the table leaves values writable
+            table = np.ascontiguousarray(np.hstack(blocks))
+            table.flags.writeable = False
+            self._tables[key] = (columns, table)
+        return self._tables[key]
 
     def get_probe_dataframe(self, probe_name: Optional[str] = None):
         """
@@ -286,26 +319,127 @@ class SimulationResult:
             raise ValueError("No probe data available")
 
         if probe_name is None:
-            # Return all probe data
-            data = {'time': self.times}
-            for pname, probe_vars in self.probe_data.items():
-                for var_name, var_values in probe_vars.items():
-                    col_name = f"{pname}.{var_name}" if len(self.probe_data) > 1 else var_name
-                    data[col_name] = var_values
-            return pd.DataFrame(data)
+            # All probe data: the probe columns of the cached table
+            columns, data = self._table(include_probes=True)
+            n_states = len(self.state_names)
+            df = pd.DataFrame(data[:, n_states:], columns=columns[n_states:], copy=True)
         else:
-            # Return specific probe data
-            if probe_name not in self.probe_data:
-                raise ValueError(
-                    f"Probe '{probe_name}' not found. "
-                    f"Available probes: {list(self.probe_data.keys())}"
-                )
+            # Specific probe data
+            data = self.get_probe_array(probe_name)
+            df = pd.DataFrame(data, columns=list(self.probe_data[probe_name]), copy=True)
+        df.insert(0, 'time', self.times)
+
+        return df
+
+    def get_probe_array(self, probe_name: str) -> np.ndarray:
+        """
+        Get all variables of one probe as a single 2D array.
+
+        The array is a read-only view of the cached export table (see
+        to_dataframe()), so vectorized work over a probe needs no per-variable
+        stacking. Columns follow the probe's variable order.
+
+        Args:
+            probe_name: Name of the probe
+
+        Returns:
+            2D NumPy array of shape [n_times, n_probe_vars]
 
-            data = {'time': self.times}
-            for var_name, var_values in self.probe_data[probe_name].items():
-                data[var_name] = var_values
+        Raises:
+            ValueError: If probe_name doesn't exist
+
+        Example:
+            >>> data = result.get_probe_array("controller")
+            >>> names = list(result.probe_data["controller"])
+            >>> peak = dict(zip(names, np.abs(data).max(axis=0)))
+        """
+        columns = self._probe_columns(probe_name)
+        _, data = self._table(include_probes=True)
+        return data[:, columns]
+
+    def _probe_columns(self, probe_name: str) -> slice:
+        """
+        Column range of one probe inside the include_probes=True table.
+
+        Args:
+            probe_name: Name of the probe
+
+        Returns:
+            Slice selecting the probe's columns (after the states and any
+            earlier probes)
+
+        Raises:
+            ValueError: If probe_name doesn't exist
+        """
+        if probe_name not in self.probe_data:
+            raise ValueError(
+                f"Probe '{probe_name}' not found. "
+                f"Available probes: {list(self.probe_data.keys())}"
+            )
+
+        start = len(self.state_names)
+        for pname, probe_vars in self.probe_data.items():
+            if pname == probe_name:
+                break
+            start += len(probe_vars)
+        return slice(start, start + len(self.probe_data[probe_name]))
+
+    def _savetxt_csv(
+        self,
+        filename: Union[str, Path],
+        columns: List[str],
+        data: np.ndarray,
+        kwargs: Dict[str, Any]
+    ) -> bool:
+        """
+        Write time plus data columns with np.savetxt if kwargs allow it.
+
+        Only index=False and a string float_format are understood; anything
+        else (a column name that would need quoting, NaN values, which pandas
+        writes as empty fields, or a compressed .gz/.bz2/.zip/.xz/.zst target)
+        is left to pandas. Without a float_format each value is written as its
+        shortest round-trip repr, matching pandas' default output.
+
+        Args:
+            filename: Output CSV file path
+            columns: Names of the data columns ('time' is prepended)
+            data: 2D array of shape [n_times, len(columns)]
+            kwargs: Keyword arguments given to the CSV export method
+
+        Returns:
+            True if the file was written, False if pandas is needed
+        """
+        header = ['time'] + columns
+        fmt = kwargs.get('float_format')
+        if (
+            set(kwargs) - {'index', 'float_format'}
+            or kwargs.get('index', False)
+            or not (fmt is None or isinstance(fmt, str))
+            or not isinstance(filename, (str, Path))
+            or str(filename).lower().endswith(_COMPRESSED_SUFFIXES)
+            or any(',' in name or '"' in name for name in header)
+        ):
+            return False
+
+        table = np.column_stack((self.times, data))
+        if np.isnan(table).any():
+            return False
+
+        if fmt is not None:
+            np.savetxt(
+                filename,
+                table,
+                fmt=fmt,
+                delimiter=',',
+                header=','.join(header),
+                comments=''
+            )
+            return True
 
-            return pd.DataFrame(data)
+        with open(filename, 'w', newline='') as f:
+            f.write(','.join(header) + '\n')
+            f.writelines(','.join(map(repr, row)) + '\n' for row in table.tolist())
+        return True
 
     def to_csv(
         self,
@@ -316,23 +450,82 @@ class SimulationResult:
         """
         Export results to a CSV file.
 
+        Without pandas-specific options the numeric table is written directly
+        with np.savetxt, skipping DataFrame construction (and the pandas
+        dependency). Any other keyword falls back to pandas.to_csv().
+
         Args:
             filename: Output CSV file path
             include_probes: Whether to include probe data
             **kwargs: Additional arguments passed to pandas.to_csv()
 
+        Note:
+            Values are written in their shortest round-trip form (as pandas
+            does) by default, or with '%.7g' for results stored as float32
+            (see Simulator.run(save_dtype=...)).
+
         Example:
             >>> result.to_csv("results.csv")
             >>> result.to_csv("results_with_probes.csv", include_probes=True, index=False)
         """
-        df = self.to_dataframe(include_probes=include_probes)
-
         # Default to not including row indices
         if 'index' not in kwargs:
             kwargs['index'] = False
 
+        # float32 carries ~7 significant digits; don't print spurious ones
+        if 'float_format' not in kwargs and self.values.dtype == np.float32:
+            kwargs['float_format'] = '%.7g'
+
+        # Fast path: plain numeric dump of the cached table
+        columns, data = self._table(include_probes)
+        if self._savetxt_csv(filename, columns, data, kwargs):
+            return
+
+        df = self.to_dataframe(include_probes=include_probes)
         df.to_csv(filename, **kwargs)
 
+    def to_npz(
+        self,
+        filename: Union[str, Path],
+        include_probes: bool = False,
+        compressed: bool = True
+    ) -> None:
+        """
+        Export results to a binary NumPy .npz archive.
+
+        Much faster and smaller than CSV for large results since values are
+        stored as raw binary instead of formatted text.
+
+        The archive contains 'time', 'values' and 'state_names'. With
+        include_probes=True, each probe variable is stored under
+        'probe.<probe_name>.<var_name>'.
+
+        Args:
+            filename: Output .npz file path
+            include_probes: Whether to include probe data
+            compressed: Use np.savez_compressed (default) instead of np.savez
+
+        Example:
+            >>> result.to_npz("results.npz")
+            >>> data = np.load("results.npz")
+            >>> data['time'], data['values'], list(data['state_names'])
+        """
+        arrays = {
+            'time': self.times,
+            'values': self.values,
+            'state_names': np.array(self.state_names, dtype=str),
+        }
+
+        if include_probes:
+            for probe_name, probe_vars in self.probe_data.items():
+                for var_name, var_values in probe_vars.items():
+                    arrays[f"probe.{probe_name}.{var_name}"] = var_values
+
+        if compressed:
+            np.savez_compressed(filename, **arrays)
+        else:
+            np.savez(filename, **arrays)
+
     def save_probe_csv(
         self,
         probe_name: str,
@@ -342,27 +535,41 @@ class SimulationResult:
         """
         Save a specific probe's data to CSV.
 
+        Like to_csv(), this writes the probe's columns of the cached table
+        directly with np.savetxt unless pandas-specific options are given.
+
         Args:
             probe_name: Name of the probe
             filename: Output CSV file path
             **kwargs: Additional arguments passed to pandas.to_csv()
 
+        Raises:
+            ValueError: If probe_name doesn't exist
+
         Example:
             >>> result.save_probe_csv("control_signals", "control_data.csv")
         """
-        df = self.get_probe_dataframe(probe_name)
-
         if 'index' not in kwargs:
             kwargs['index'] = False
+        if 'float_format' not in kwargs and self.values.dtype == np.float32:
+            kwargs['float_format'] = '%.7g'
 
+        data = self.get_probe_array(probe_name)
+        if self._savetxt_csv(filename, list(self.probe_data[probe_name]), data, kwargs):
+            return
+
+        df = self.get_probe_dataframe(probe_name)
         df.to_csv(filename, **kwargs)
 
-    def get_state(self, state_name: str) -> np.ndarray:
+    def get_state(self, state_name: str, copy: bool = True) -> np.ndarray:
         """
         Get time series data for a specific state.
 
         Args:
             state_name: Name of the state variable
+            copy: Return an independent copy (default). With copy=False a
+                read-only view of the stored column is returned instead,
+                avoiding the allocation when the data is only read.
 
         Returns:
             NumPy array of state values over time
@@ -372,16 +579,21 @@ class SimulationResult:
 
         Example:
             >>> position = result.get_state("plant.x1")
-            >>> velocity = result.get_state("plant.x2")
+            >>> velocity = result.get_state("plant.x2", copy=False)
         """
         try:
-            idx = self.state_names.index(state_name)
-            return self.values[:, idx].copy()
-        except ValueError:
+            idx = self._state_index[state_name]
+        except KeyError:
             raise ValueError(
                 f"State '{state_name}' not found. "
                 f"Available states: {self.state_names}"
             )
+        if copy:
+            return self.values[:, idx].copy()
+
+        column = self.values[:, idx]
+        column.flags.writeable = False
+        return column
 
     def get_states(self, state_names: List[str]) -> np.ndarray:
         """
@@ -397,26 +609,37 @@ class SimulationResult:
             >>> data = result.get_states(["plant.x1", "plant.x2"])
             >>> print(data.shape)
         """
-        indices = []
-        for name in state_names:
-            try:
-                indices.append(self.state_names.index(name))
-            except ValueError:
-                raise ValueError(f"State '{name}' not found")
+        try:
+            indices = np.fromiter(
+                map(self._state_index.__getitem__, state_names),
+                dtype=np.intp,
+                count=len(state_names)
+            )
+        except KeyError as e:
+            raise ValueError(f"State '{e.args[0]}' not found")
 
-        return self.values[:, indices].copy()
+        # Fancy indexing already returns a new array
+        return self.values[:, indices]
 
     def slice_time(
         self,
         t_start: Optional[float] = None,
-        t_end: Optional[float] = None
+        t_end: Optional[float] = None,
+        copy: bool = False
     ) -> 'SimulationResult':
         """
         Create a new SimulationResult with data in a time range.
 
+        The range is closed on both ends: points at exactly t_start and t_end
+        are kept. times is monotonic, so both bounds are found by binary
+        search; no boolean mask over the whole time vector is built.
+
         Args:
             t_start: Start time (None for beginning)
-            t_end: End time (None for end)
+            t_end: End time, inclusive (None for end)
+            copy: By default the sliced arrays are views into this result's
+                data. Set copy=True to get compact, independent arrays (e.g.
+                to keep a short window while releasing a long simulation).
 
         Returns:
             New SimulationResult with sliced data
@@ -434,19 +657,23 @@ class SimulationResult:
         if t_end is None:
             end_idx = len(self.times)
         else:
-            end_idx = np.searchsorted(self.times, t_end)
+            end_idx = np.searchsorted(self.times, t_end, side='right')
+
+        window = slice(start_idx, end_idx)
+        take = (lambda a: a[window].copy()) if copy else (lambda a: a[window])
 
         # Slice main data
-        sliced_times = self.times[start_idx:end_idx]
-        sliced_values = self.values[start_idx:end_idx, :]
+        sliced_times = take(self.times)
+        sliced_values = take(self.values)
 
         # Slice probe data
-        sliced_probe_data = {}
-        for probe_name, probe_vars in self.probe_data.items():
-            sliced_probe_data[probe_name] = {
-                var_name: var_values[start_idx:end_idx]
+        sliced_probe_data = {
+            probe_name: {
+                var_name: take(var_values)
                 for var_name, var_values in probe_vars.items()
             }
+            for probe_name, probe_vars in self.probe_data.items()
+        }
 
         # Create new result
         return SimulationResult(
@@ -459,6 +686,30 @@ class SimulationResult:
             metadata={**self.metadata, 'sliced': True}
         )
 
+    def stats(self) -> Dict[str, np.ndarray]:
+        """
+        Get per-state statistics as arrays, computed column-wise in one pass each.
+
+        Returns:
+            Dictionary of {statistic: array of shape (n_states,)} with keys
+            'mean', 'std', 'min', 'max', 'rms' and 'final'. Entries are in the
+            same order as state_names.
+
+        Example:
+            >>> stats = result.stats()
+            >>> peak = dict(zip(result.state_names, stats['max']))
+        """
+        values = self.values
+        return {
+            'mean': values.mean(axis=0),
+            'std': values.std(axis=0),
+            'min': values.min(axis=0),
+            'max': values.max(axis=0),
+            # Column sums of squares without a (n_times, n_states) temporary
+            'rms': np.sqrt(np.einsum('ij,ij->j', values, values) / len(values)),
+            'final': values[-1].copy(),
+        }
+
     def summary(self) -> Dict[str, Any]:
         """
         Get statistical summary of the simulation results.
@@ -470,19 +721,15 @@ class SimulationResult:
             >>> stats = result.summary()
             >>> print(stats['plant.x1'])
         """
-        summary_dict = {}
-
-        for i, name in enumerate(self.state_names):
-            data = self.values[:, i]
-            summary_dict[name] = {
-                'mean': float(np.mean(data)),
-                'std': float(np.std(data)),
-                'min': float(np.min(data)),
-                'max': float(np.max(data)),
-                'final': float(data[-1])
-            }
-
-        return summary_dict
+        # One column-wise reduction per statistic instead of one per state
+        stats = self.stats()
+        keys = ('mean', 'std', 'min', 'max', 'final')
+        columns = zip(*(stats[key].tolist() for key in keys))
+
+        return {
+            name: dict(zip(keys, column))
+            for name, column in zip(self.state_names, columns)
+        }
 
     def print_summary(self) -> None:
         """
@@ -501,15 +748,19 @@ class SimulationResult:
 
         if self.state_names:
             print("State Statistics (first 10):")
-            summary = self.summary()
-            for i, name in enumerate(self.state_names[:10]):
-                stats = summary[name]
-                print(
-                    f"  {name:30s} "
-                    f"mean={stats['mean']:8.3f} "
-                    f"std={stats['std']:8.3f} "
-                    f"range=[{stats['min']:8.3f}, {stats['max']:8.3f}]"
-                )
+            # Only the printed columns are reduced
+            head = self.values[:, :10]
+            means, stds = head.mean(axis=0), head.std(axis=0)
+            mins, maxs = head.min(axis=0), head.max(axis=0)
+            lines = [
+                f"  {name:30s} "
+                f"mean={mean:8.3f} "
+                f"std={std:8.3f} "
+                f"range=[{vmin:8.3f}, {vmax:8.3f}]"
+                for name, mean, std, vmin, vmax
+                in zip(self.state_names[:10], means, stds, mins, maxs)
+            ]
+            print("\n".join(lines))
 
             if len(self.state_names) > 10:
                 print(f"  ... ({len(self.state_names) - 10} more states)")
@@ -12,7 +12,8 @@ Enhanced features:
 - Rich SimulationResult objects with export capabilities
 """
 
-from typing import Tuple, Dict, Any, Optional, List, Union
+import re
+from typing import Tuple, Dict, Any, Callable, Optional, List, Union
 import numpy as np
 from .backend import get_jl
 from .system import System
@@ -20,6 +21,9 @@ from .events import TimeEvent, ContinuousEvent
 from .result import SimulationResult, DataProbe
 from .expression_parser import ObservedExpressionEvaluator
 
+# Dotted state names (e.g. "plant.x1") inside string event conditions
+_STATE_NAME_RE = re.compile(r"\b[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+")
+
 
 class Simulator:
     """
@@ -64,6 +68,151 @@ class Simulator:
         self.system = system
         self._jl = get_jl()
 
+        # Cached ODEProblem (held here, so it is freed with the simulator) and
+        # the (compile version, jac, sparse) it was built for
+        self._prob: Any = None
+        self._prob_key: Optional[Tuple[int, bool, bool]] = None
+
+        # Memoized event callbacks: {(id(event), save_positions): (event, julia_callback)}
+        self._callback_cache: Dict[Tuple[int, bool], Tuple[Any, Any]] = {}
+        self._callback_version = self.system._compile_version
+        # Parameter tables shared by the event affects (Julia NamedTuple, held
+        # here so it is freed with the simulator); built with the callbacks
+        self._event_params: Any = None
+
+        # Compile version for which the Julia system bindings were made
+        self._bindings_version: Optional[int] = None
+        self._state_names: Optional[List[str]] = None
+        self._state_index: Dict[str, int] = {}
+
+        # (inputs key, Julia solution, parameter dict) of the last solve
+        self._last_solve: Optional[Tuple[Tuple, Any, Dict[str, float]]] = None
+
+    def _ensure_system_bindings(self) -> str:
+        """
+        Bind the compiled system, its unknowns and parameters to Julia globals.
+
+        The bindings (and the Python-style state names) only change when the
+        system is recompiled, so they are made once per compile instead of on
+        every run.
+
+        Returns:
+            Julia variable name for the system (e.g. "_sys_my_system")
+        """
+        sys_name = f"_sys_{self.system.name}"
+        if self._bindings_version == self.system._compile_version:
+            return sys_name
+
+        # Store system reference in Julia for convenience
+        self._jl.seval(f"{sys_name} = _simplified_{self.system.name}")
+
+        # Get unknowns and parameters from the simplified system
+        self._jl.seval(f"_unknowns_{self.system.name} = unknowns({sys_name})")
+        self._jl.seval(f"_params_{self.system.name} = parameters({sys_name})")
+
+        # Get state names in one call, removing the (t) suffix and converting
+        # ₊ to . for Python-style naming
+        try:
+            self._state_names = list(self._jl.seval(
+                f'String[replace(string(v), "(t)" => "", "₊" => ".") '
+                f'for v in _unknowns_{self.system.name}]'
+            ))
+        except Exception:
+            self._state_names = None
+
+        # Name -> column lookup used to gather probe columns after each solve
+        self._state_index = {name: i for i, name in enumerate(self._state_names or [])}
+
+        self._bindings_version = self.system._compile_version
+        return sys_name
+
+    def invalidate_cache(self) -> 'Simulator':
+        """
+        Drop the cached ODEProblem and system bindings so the next run()
+        rebuilds them from scratch.
+
+        The cache is invalidated automatically when the system is recompiled;
+        call this only to force a rebuild.
+
+        Returns:
+            self (for method chaining)
+        """
+        self._prob = None
+        self._prob_key = None
+        self._bindings_version = None
+        self._last_solve = None
+        return self
+
+    def _solve_key(
+        self,
+        t_span: Tuple[float, float],
+        u0: Optional[Dict[str, float]],
+        params: Optional[Dict[str, float]],
+        *options: Any
+    ) -> Optional[Tuple]:
+        """
+        Key identifying everything a run's solution depends on.
+
+        Covers the compiled system, the module defaults (which update_param()
+        and update_state() change), the u0/params overrides, t_span and the
+        solve options. Systems with events get no key, so they are always
+        re-solved: their Python affects may have side effects.
+
+        Args:
+            t_span: Time span tuple (t_start, t_end)
+            u0: Optional dict of initial conditions
+            params: Optional dict of parameter overrides
+            *options: Remaining run() options that affect the solution
+
+        Returns:
+            Hashable key, or None if the solution must not be reused
+        """
+        if self.system._events:
+            return None
+
+        defaults = tuple(
+            (module.name, tuple(module._states.items()), tuple(module._params.items()))
+            for module in self.system._modules
+        )
+        return (
+            self.system._compile_version,
+            defaults,
+            None if u0 is None else tuple(sorted(u0.items())),
+            None if params is None else tuple(sorted(params.items())),
+            tuple(t_span),
+            options,
+        )
+
+    def precompile(
+        self,
+        solver: str = "Rodas5",
+        t_span: Tuple[float, float] = (0.0, 1e-6),
+        **run_kwargs: Any
+    ) -> 'Simulator':
+        """
+        Warm up Julia's JIT by running a very short simulation.
+
+        The first run() with a given solver compiles the problem functions and
+        specializes the solver for this system, which can take seconds. Calling
+        precompile() moves that cost out of the first real run; the ODEProblem
+        built here is also reused (via remake) by later runs.
+
+        Args:
+            solver: Solver to specialize (should match later runs)
+            t_span: Time span of the warm-up run (default: (0.0, 1e-6))
+            **run_kwargs: Further run() options that affect the problem, such as
+                jac=True or sparse=True (should match later runs)
+
+        Returns:
+            self (for method chaining)
+
+        Example:
+            >>> sim = Simulator(system).precompile(jac=True)
+            >>> result = sim.run(t_span=(0.0, 10.0), dt=0.01, jac=True)  # no warm-up cost
+        """
+        self.run(t_span=t_span, solver=solver, return_result=False, **run_kwargs)
+        return self
+
     def run(
         self,
         t_span: Tuple[float, float],
@@ -72,7 +221,14 @@ class Simulator:
         dt: Optional[float] = None,
         solver: str = "Rodas5",
         probes: Optional[Union[DataProbe, List[DataProbe], Dict[str, DataProbe]]] = None,
-        return_result: bool = True
+        return_result: bool = True,
+        save_dtype: Optional[Any] = None,
+        jac: bool = False,
+        sparse: bool = False,
+        save_everystep: bool = True,
+        save_end_only: bool = False,
+        static_arrays: bool = False,
+        out: Optional[np.ndarray] = None
     ) -> Union[SimulationResult, Tuple[np.ndarray, np.ndarray]]:
         """
         Run the simulation and return results.
@@ -85,6 +241,11 @@ class Simulator:
         5. Extracts data from solution (including probe data if specified)
         6. Returns SimulationResult or raw numpy arrays
 
+        When a system without events is run again with exactly the same inputs
+        (module defaults, u0, params, t_span and solve options), steps 3-4 are
+        skipped and the previous solution is reused; only the extraction
+        (e.g. with different probes) is repeated.
+
         Args:
             t_span: Time span tuple (t_start, t_end)
             u0: Optional dict of initial conditions {state_name: value}
@@ -94,13 +255,42 @@ class Simulator:
             dt: Optional time step for saving solution points
                 If None, uses adaptive time stepping
             solver: Solver name (default: "Rodas5" for stiff/DAE systems)
-                Other options: "Tsit5", "TRBDF2", "QNDF", etc.
+                Other options: "Tsit5", "TRBDF2", "QNDF", etc. "auto" picks
+                Rodas5P for DAEs (mass-matrix problems) and AutoTsit5(Rodas5P())
+                for ODEs, which runs explicit Tsit5 steps and switches to Rodas5P
+                only while the problem is stiff
             probes: Optional data probe(s) for observing specific variables:
                 - Single DataProbe
                 - List of DataProbe objects
                 - Dict of {name: DataProbe}
             return_result: If True, return SimulationResult object (default)
                           If False, return raw (times, values) tuple for backward compatibility
+            save_dtype: Optional NumPy dtype for the stored trajectory (e.g. np.float32).
+                The solver always integrates in Float64; only the state values and
+                probe data handed back to Python are downcast. None keeps float64.
+            jac: If True, have ModelingToolkit generate a compiled symbolic Jacobian
+                for the ODEProblem. Implicit solvers (Rodas5, TRBDF2, QNDF, ...)
+                then use it in their Newton steps instead of automatic
+                differentiation or finite differences.
+            sparse: If True, build the Jacobian as a sparse matrix whose sparsity
+                pattern ModelingToolkit derives from the equations (jac_prototype),
+                so each Newton step factorizes only the nonzeros. Worth enabling
+                for large, loosely coupled systems; combine with jac=True.
+            save_everystep: If False and dt is None, store only the start and end
+                points instead of every adaptive step (ignored when dt is given,
+                since saveat already fixes the saved points)
+            save_end_only: If True, store only the final state (overrides dt and
+                save_everystep). Useful for steady-state checks and parameter
+                estimation, where the trajectory itself is not needed.
+            static_arrays: If True, build an out-of-place ODEProblem whose state is a
+                StaticArrays SVector, so each solver step stays on the stack.
+                Intended for small systems (roughly 20 states or fewer); larger
+                systems compile slowly and run slower this way.
+            out: Optional preallocated float64 array of shape (n_timepoints, n_states)
+                to receive the state values. Julia writes into it directly and it
+                is returned as the values array, so parameter sweeps can reuse one
+                buffer instead of allocating a new matrix per run. The shape must
+                match the saved time points (e.g. those fixed by dt).
 
         Returns:
             If return_result=True (default):
@@ -137,190 +327,99 @@ class Simulator:
         if t_span[0] >= t_span[1]:
             raise ValueError(f"t_start must be less than t_end, got {t_span}")
 
-        t_start, t_end = t_span
+        if out is not None and (out.dtype != np.float64 or out.ndim != 2):
+            raise ValueError(
+                f"out must be a 2D float64 array, got {out.ndim}D {out.dtype}"
+            )
 
         try:
-            # Get the compiled system
-            julia_system = self.system._compiled_system
-
-            # Store system reference in Julia for convenience
-            sys_name = f"_sys_{self.system.name}"
-            self._jl.seval(f"{sys_name} = _simplified_{self.system.name}")
-
-            # Get unknowns and parameters from the simplified system
-            self._jl.seval(f"_unknowns_{self.system.name} = unknowns({sys_name})")
-            self._jl.seval(f"_params_{self.system.name} = parameters({sys_name})")
-
-            # Build initial conditions
-            # If u0 not provided, use defaults (zeros for now, as we can't easily extract defaults)
-            if u0 is None:
-                # Use defaults: build a map with zeros or module defaults
-                u0_dict = {}
-                for module in self.system._modules:
-                    for state_name, default_val in module._states.items():
-                        full_name = f"{module.name}.{state_name}"
-                        u0_dict[full_name] = default_val
+            # Back-to-back runs with identical inputs (e.g. differing only in
+            # probes) reuse the previous solution instead of integrating again
+            solve_key = self._solve_key(
+                t_span, u0, params, dt, solver, jac, sparse,
+                save_everystep, save_end_only, static_arrays
+            )
+            last = self._last_solve
+            if solve_key is not None and last is not None and last[0] == solve_key:
+                _, solution, params_dict = self._last_solve
+                sys_name = self._ensure_system_bindings()
+                setattr(self._jl, f"_sol_{self.system.name}", solution)
             else:
-                u0_dict = u0
-
-            # Build parameters - merge defaults with user-provided
-            params_dict = {}
-            # First, add all defaults
-            for module in self.system._modules:
-                for param_name, default_val in module._params.items():
-                    full_name = f"{module.name}.{param_name}"
-                    params_dict[full_name] = default_val
-
-            # Then override with user-provided params
-            if params is not None:
-                params_dict.update(params)
-
-            # Build u0 and params maps using Julia code that iterates through system variables
-            # This is more robust than trying to construct variable names
-
-            # Create Julia dictionary for u0 mapping (Python name -> value)
-            self._jl.seval(f"_u0_dict_{self.system.name} = Dict()")
-            for full_name, value in u0_dict.items():
-                # Escape the name for Julia string
-                self._jl.seval(
-                    f"_u0_dict_{self.system.name}[\"{full_name}\"] = {value}"
-                )
-
-            # Create Julia dictionary for params mapping (Python name -> value)
-            self._jl.seval(f"_params_dict_{self.system.name} = Dict()")
-            for full_name, value in params_dict.items():
-                self._jl.seval(
-                    f"_params_dict_{self.system.name}[\"{full_name}\"] = {value}"
+                # Julia bindings, u0/parameter maps and the (cached) ODEProblem
+                sys_name, params_dict = self._prepare_problem(
+                    t_span, u0, params, jac, sparse, static_arrays
                 )
 
-            # Build u0 map by matching variable names
-            # Julia code to iterate through unknowns and build the map
-            build_u0_code = f"""
-            _u0_map_{self.system.name} = Dict()
-            for var in _unknowns_{self.system.name}
-                var_str = string(var)
-                # Remove (t) suffix if present
-                var_name = replace(var_str, "(t)" => "")
-                # Convert ₊ to . for Python-style naming
-                python_name = replace(var_name, "₊" => ".")
-                if haskey(_u0_dict_{self.system.name}, python_name)
-                    _u0_map_{self.system.name}[var] = _u0_dict_{self.system.name}[python_name]
-                else
-                    # Default to 0 if not specified
-                    _u0_map_{self.system.name}[var] = 0.0
-                end
-            end
-            """
-            self._jl.seval(build_u0_code)
-
-            # Build params map similarly
-            build_params_code = f"""
-            _params_map_{self.system.name} = Dict()
-            for param in _params_{self.system.name}
-                param_str = string(param)
-                # Convert ₊ to . for Python-style naming
-                python_name = replace(param_str, "₊" => ".")
-                if haskey(_params_dict_{self.system.name}, python_name)
-                    _params_map_{self.system.name}[param] = _params_dict_{self.system.name}[python_name]
-                else
-                    # Default to 1 if not specified
-                    _params_map_{self.system.name}[param] = 1.0
-                end
-            end
-            """
-            self._jl.seval(build_params_code)
-
-            # Merge u0 and params into a single map for ODEProblem
-            self._jl.seval(
-                f"_combined_map_{self.system.name} = merge(_u0_map_{self.system.name}, _params_map_{self.system.name})"
-            )
-
-            # Create ODEProblem using modern API
-            # Format: ODEProblem(system, combined_map, tspan)
-            self._jl.seval(
-                f"_prob_{self.system.name} = ODEProblem("
-                f"{sys_name}, _combined_map_{self.system.name}, ({t_start}, {t_end}))"
-            )
+                # Solve keyword arguments
+                solve_kwargs = []
 
-            # Build callbacks from registered events
-            callbacks_list = []
-            if self.system._events:
-                callbacks_list = self._build_callbacks(self.system._events, self.system.name)
-
-            # Solve the problem with specified solver and callbacks
-            if callbacks_list:
-                # Combine callbacks using CallbackSet
-                callbacks_str = ", ".join(callbacks_list)
-                self._jl.seval(
-                    f"_callback_set_{self.system.name} = CallbackSet({callbacks_str})"
-                )
+                # Combine callbacks from registered events
+                callback_kwarg = self._callback_kwarg()
+                if callback_kwarg is not None:
+                    solve_kwargs.append(callback_kwarg)
 
-                if dt is not None:
-                    # Use saveat for fixed time steps with callbacks
-                    solve_expr = (
-                        f"_sol_{self.system.name} = solve("
-                        f"_prob_{self.system.name}, {solver}(), "
-                        f"callback=_callback_set_{self.system.name}, saveat={dt})"
-                    )
-                else:
-                    # Adaptive time stepping with callbacks
-                    solve_expr = (
-                        f"_sol_{self.system.name} = solve("
-                        f"_prob_{self.system.name}, {solver}(), "
-                        f"callback=_callback_set_{self.system.name})"
-                    )
-            else:
-                # No callbacks
-                if dt is not None:
+                if save_end_only:
+                    # Only the final state is stored
+                    solve_kwargs.extend(["save_everystep=false", "save_start=false"])
+                elif dt is not None:
                     # Use saveat for fixed time steps
-                    solve_expr = (
-                        f"_sol_{self.system.name} = solve("
-                        f"_prob_{self.system.name}, {solver}(), saveat={dt})"
-                    )
+                    solve_kwargs.append(f"saveat={dt}")
+                elif not save_everystep:
+                    # Adaptive time stepping, storing only the start and end points
+                    solve_kwargs.append("save_everystep=false")
+
+                solve_kwargs_str = "".join(f", {kwarg}" for kwarg in solve_kwargs)
+                if solver == "auto":
+                    solver_expr = f"_auto_solver(_prob_{self.system.name})"
                 else:
-                    # Adaptive time stepping
-                    solve_expr = (
-                        f"_sol_{self.system.name} = solve("
-                        f"_prob_{self.system.name}, {solver}())"
-                    )
+                    solver_expr = f"{solver}()"
+                solve_expr = (
+                    f"_sol_{self.system.name} = solve("
+                    f"_prob_{self.system.name}, {solver_expr}{solve_kwargs_str})"
+                )
 
-            self._jl.seval(solve_expr)
+                self._jl.seval(solve_expr)
 
-            # Get the solution object
-            solution = self._jl.seval(f"_sol_{self.system.name}")
+                # Get the solution object
+                solution = self._jl.seval(f"_sol_{self.system.name}")
+                self._last_solve = (
+                    (solve_key, solution, params_dict) if solve_key is not None else None
+                )
 
             # Extract time points and values from Julia Solution
             # Solution.t gives time points, Solution.u gives state vectors
             times_jl = self._jl.seval(f"_sol_{self.system.name}.t")
-            values_jl = self._jl.seval(f"_sol_{self.system.name}.u")
-
-            # Convert to numpy arrays
-            # times_jl is a Julia Vector{Float64}
-            times = np.array(times_jl)
-
-            # values_jl is a Julia Vector{Vector{Float64}} (vector of state vectors)
-            # Convert to 2D numpy array: shape (n_timepoints, n_states)
-            values_list = []
-            for i in range(len(values_jl)):
-                state_vector = np.array(values_jl[i])
-                values_list.append(state_vector)
-
-            values = np.array(values_list)
-
-            # Get state names from the simplified system (Julia)
-            try:
-                # Get unknowns from the simplified system
-                unknowns_jl = self._jl.seval(f"unknowns({sys_name})")
-                state_names = []
-                for i in range(len(unknowns_jl)):
-                    var_str = self._jl.seval(f"string(unknowns({sys_name})[{i+1}])")
-                    # Remove (t) suffix if present
-                    if "(t)" in var_str:
-                        var_str = var_str.replace("(t)", "")
-                    # Convert ₊ to . for Python-style naming
-                    var_str = var_str.replace("₊", ".")
-                    state_names.append(var_str)
-            except Exception:
+
+            # times_jl is a Julia Vector{Float64}; wrap it without copying
+            # (the array keeps the Julia vector alive). A solution kept for
+            # reuse is shared by later results, so each result gets its own
+            # copy there: editing one result's times must not change another's
+            if solve_key is not None:
+                times = np.array(times_jl)
+            else:
+                times = np.asarray(times_jl)
+
+            if out is not None:
+                # Fill the caller's buffer in place (no Julia matrix is allocated)
+                self._jl.seval("_copy_solution!")(out, solution)
+                values = out
+            else:
+                # Stack the Vector{Vector{Float64}} of state vectors into one contiguous
+                # Matrix{Float64} (n_timepoints, n_states) on the Julia side. Julia is
+                # column-major, so each state's time series is contiguous
+                values_jl = self._jl.seval(
+                    f"_sol_matrix_{self.system.name} = "
+                    f"permutedims(reduce(hcat, _sol_{self.system.name}.u))"
+                )
+
+                # Wrap the Julia matrix without copying: a Fortran-ordered
+                # (n_timepoints, n_states) array where values[:, i] is contiguous
+                values = np.asarray(values_jl)
+
+            # State names of the simplified system (fetched with the bindings)
+            if self._state_names is not None:
+                state_names = list(self._state_names)
+            else:
                 # Fallback: use generic names
                 state_names = [f"state_{i}" for i in range(values.shape[1])]
 
@@ -328,9 +427,15 @@ class Simulator:
             probe_data = {}
             if probes is not None:
                 probe_data = self._extract_probe_data(
-                    probes, times, values, state_names, sys_name, self.system.name, params_dict
+                    probes, times, values, state_names, sys_name, self.system.name, params_dict,
+                    dtype=save_dtype
                 )
 
+            # Downcast the stored trajectory (probes are evaluated in full precision
+            # first and downcast as one buffer above)
+            if save_dtype is not None:
+                values = values.astype(save_dtype, copy=False)
+
             # Return result based on return_result flag
             if return_result:
                 # Create and return SimulationResult object
@@ -344,6 +449,10 @@ class Simulator:
                     metadata={
                         't_span': t_span,
                         'dt': dt,
+                        'jac': jac,
+                        'sparse': sparse,
+                        'save_end_only': save_end_only,
+                        'static_arrays': static_arrays,
                         'n_events': len(self.system._events) if self.system._events else 0
                     }
                 )
@@ -357,6 +466,172 @@ class Simulator:
                 "Check that initial conditions and parameters are correctly specified."
             ) from e
 
+    def _prepare_problem(
+        self,
+        t_span: Tuple[float, float],
+        u0: Optional[Dict[str, float]],
+        params: Optional[Dict[str, float]],
+        jac: bool,
+        sparse: bool,
+        static_arrays: bool
+    ) -> Tuple[str, Dict[str, float]]:
+        """
+        Bind _prob_{system} to an ODEProblem for the given u0, params and t_span.
+
+        The problem built by an earlier call is remade when only numeric values
+        changed; otherwise a new ODEProblem is constructed and cached.
+
+        Args:
+            t_span: Time span tuple (t_start, t_end)
+            u0: Optional dict of initial conditions (None uses module defaults)
+            params: Optional dict of parameter overrides
+            jac, sparse, static_arrays: ODEProblem options, see run()
+
+        Returns:
+            Tuple of (Julia system variable name, merged parameter dict)
+        """
+        t_start, t_end = t_span
+
+        # Julia bindings for the compiled system (refreshed only after a recompile)
+        sys_name = self._ensure_system_bindings()
+
+        # Build initial conditions
+        # If u0 not provided, use defaults (zeros for now, as we can't easily extract defaults)
+        if u0 is None:
+            # Use defaults: build a map with zeros or module defaults
+            u0_dict = {}
+            for module in self.system._modules:
+                for state_name, default_val in module._states.items():
+                    full_name = f"{module.name}.{state_name}"
+                    u0_dict[full_name] = default_val
+        else:
+            u0_dict = u0
+
+        # Build parameters - merge defaults with user-provided
+        params_dict = {}
+        # First, add all defaults
+        for module in self.system._modules:
+            for param_name, default_val in module._params.items():
+                full_name = f"{module.name}.{param_name}"
+                params_dict[full_name] = default_val
+
+        # Then override with user-provided params
+        if params is not None:
+            params_dict.update(params)
+
+        # Create Julia dictionaries for u0 and params mapping, keyed by the
+        # Julia variable name (Symbol, "." -> "₊"), each in a single seval call
+        self._set_julia_dict(f"_u0_dict_{self.system.name}", u0_dict)
+        self._set_julia_dict(f"_params_dict_{self.system.name}", params_dict)
+
+        # Build u0 and params maps by looking up each variable's name directly
+        # (getname returns the namespaced Symbol, e.g. :plant₊x for plant.x(t));
+        # unspecified states default to 0 and unspecified parameters to 1
+        self._jl.seval(
+            f"_u0_map_{self.system.name} = Dict("
+            f"v => get(_u0_dict_{self.system.name}, ModelingToolkit.getname(v), 0.0) "
+            f"for v in _unknowns_{self.system.name})"
+        )
+        self._jl.seval(
+            f"_params_map_{self.system.name} = Dict("
+            f"p => get(_params_dict_{self.system.name}, ModelingToolkit.getname(p), 1.0) "
+            f"for p in _params_{self.system.name})"
+        )
+
+        # Reuse the ODEProblem built by an earlier run when only u0/params/t_span
+        # changed; constructing a new one regenerates and recompiles its functions
+        prob_key = (self.system._compile_version, jac, sparse)
+        if self._prob_key == prob_key and not static_arrays:
+            self._jl.seval(
+                f"prob -> global _prob_{self.system.name} = remake(prob; "
+                f"u0=_u0_map_{self.system.name}, p=_params_map_{self.system.name}, "
+                f"tspan=({t_start}, {t_end}))"
+            )(self._prob)
+        else:
+            # Merge u0 and params into a single map for ODEProblem
+            self._jl.seval(
+                f"_combined_map_{self.system.name} = merge(_u0_map_{self.system.name}, _params_map_{self.system.name})"
+            )
+
+            # Optional ODEProblem keywords
+            prob_kwargs = []
+            if jac:
+                prob_kwargs.append("jac=true")
+            if sparse:
+                prob_kwargs.append("sparse=true")
+            prob_type = ""
+            if static_arrays:
+                # Out-of-place problem on a stack-allocated SVector state
+                prob_type = "{false}"
+                prob_kwargs.append("u0_constructor=x -> SVector(x...)")
+            prob_kwargs_str = f"; {', '.join(prob_kwargs)}" if prob_kwargs else ""
+
+            # Create ODEProblem using modern API
+            # Format: ODEProblem(system, combined_map, tspan; kwargs...)
+            self._prob, self._prob_key = None, None
+            prob = self._jl.seval(
+                f"_prob_{self.system.name} = ODEProblem{prob_type}("
+                f"{sys_name}, _combined_map_{self.system.name}, ({t_start}, {t_end})"
+                f"{prob_kwargs_str})"
+            )
+            if not static_arrays:
+                # Static problems are rebuilt each run: remake with a symbolic
+                # u0 map would not preserve the SVector state type
+                self._prob, self._prob_key = prob, prob_key
+
+        return sys_name, params_dict
+
+    def _callback_kwarg(self, save_positions: bool = True) -> Optional[str]:
+        """
+        Build the CallbackSet for the system's events.
+
+        Args:
+            save_positions: Save the state just before and after each event
+                (the DifferentialEquations default). run_batch() turns this off
+                so every trajectory is saved on the same time grid.
+
+        Returns:
+            The solve() keyword argument "callback=..." or None without events
+        """
+        if not self.system._events:
+            return None
+
+        continuous_callbacks, discrete_callbacks = self._build_callbacks(
+            self.system._events, self.system.name, save_positions
+        )
+        if not (continuous_callbacks or discrete_callbacks):
+            return None
+
+        # Combine the callback objects using CallbackSet, passing the
+        # (continuous, discrete) tuples directly instead of splatting them
+        self._jl.seval(
+            f"(c, d) -> global _callback_set_{self.system.name} = CallbackSet(Tuple(c), Tuple(d))"
+        )(continuous_callbacks, discrete_callbacks)
+        return f"callback=_callback_set_{self.system.name}"
+
+    def _set_julia_dict(self, julia_var: str, values: Dict[str, float]) -> None:
+        """
+        Create a Julia Dict{Symbol, Float64} mapping Julia variable names to values.
+
+        Names and values are handed to Julia as one Python list and one float64
+        array and zipped into the Dict by a single seval, so no Julia source is
+        generated per entry.
+
+        Args:
+            julia_var: Name of the Julia global to assign
+            values: Dict of {python_name: value}, e.g. {"plant.x": 1.0}
+        """
+        names = [name.replace(".", "₊") for name in values]
+        vals = np.fromiter(values.values(), dtype=np.float64, count=len(values))
+
+        setattr(self._jl, f"{julia_var}_names", names)
+        setattr(self._jl, f"{julia_var}_vals", vals)
+        self._jl.seval(
+            f"{julia_var} = Dict{{Symbol, Float64}}(zip("
+            f"Symbol.(PythonCall.pyconvert(Vector{{String}}, {julia_var}_names)), "
+            f"PythonCall.pyconvert(Vector{{Float64}}, {julia_var}_vals)))"
+        )
+
     def _extract_probe_data(
         self,
         probes: Union[DataProbe, List[DataProbe], Dict[str, DataProbe]],
@@ -365,7 +640,8 @@ class Simulator:
         state_names: List[str],
         sys_name: str,
         system_name: str,
-        params_dict: Dict[str, float]
+        params_dict: Dict[str, float],
+        dtype: Optional[Any] = None
     ) -> Dict[str, Dict[str, np.ndarray]]:
         """
         Extract data for specified probes from the Julia solution.
@@ -377,6 +653,9 @@ class Simulator:
             state_names: List of state names
             sys_name: Julia variable name for the system
             system_name: Python system name
+            params_dict: Parameter values used for the run
+            dtype: Optional dtype the shared probe buffer is converted to once
+                filled (None keeps float64)
 
         Returns:
             Dictionary of {probe_name: {variable_name: values}}
@@ -391,383 +670,522 @@ class Simulator:
         else:
             raise TypeError(f"probes must be DataProbe, list, or dict, got {type(probes)}")
 
-        probe_data = {}
+        # Probed unknowns are already in the solution matrix: take those columns
+        # directly instead of searching and re-indexing the solution in Julia.
+        # The name -> column map is cached with the system bindings
+        state_index = self._state_index or {name: i for i, name in enumerate(state_names)}
+
+        # All remaining (observed) probe variables are gathered in one Julia call
+        observed_names = list(dict.fromkeys(
+            var_name
+            for probe in probes_dict.values()
+            for var_name in probe.variables
+            if var_name not in state_index
+        ))
+        observed_values = self._extract_observed_values(observed_names, sys_name, system_name)
+
+        # Every probed variable gets one column of a single shared buffer; each
+        # probe's entries are column views into it rather than separate copies
+        entries = [
+            (probe_name, var_name, custom_name)
+            for probe_name, probe in probes_dict.items()
+            for var_name, custom_name in zip(probe.variables, probe.names)
+        ]
+        buffer = np.empty((len(times), len(entries)))
+
+        # Probed unknowns are filled with one fancy-index into the solution matrix
+        state_cols = [j for j, (_, var_name, _) in enumerate(entries) if var_name in state_index]
+        if state_cols:
+            buffer[:, state_cols] = values[:, [state_index[entries[j][1]] for j in state_cols]]
+
+        for j, (_, var_name, _) in enumerate(entries):
+            if var_name in state_index:
+                continue
+            if var_name in observed_values:
+                buffer[:, j] = observed_values[var_name]
+            else:
+                buffer[:, j] = self._extract_probe_variable(
+                    var_name, times, values, state_names, sys_name, system_name, params_dict
+                )
+
+        # One conversion for all probes keeps them views of a single buffer
+        if dtype is not None:
+            buffer = buffer.astype(dtype, copy=False)
+
+        probe_data = {probe_name: {} for probe_name in probes_dict}
+        for j, (probe_name, _, custom_name) in enumerate(entries):
+            probe_data[probe_name][custom_name] = buffer[:, j]
+
+        return probe_data
+
+    def _extract_probe_variable(
+        self,
+        var_name: str,
+        times: np.ndarray,
+        values: np.ndarray,
+        state_names: List[str],
+        sys_name: str,
+        system_name: str,
+        params_dict: Dict[str, float]
+    ) -> np.ndarray:
+        """
+        Search for and extract a single probe variable from the Julia solution.
+
+        This is the slow path for variables that are neither unknowns nor
+        found by the batched observed extraction.
+
+        Args:
+            var_name: Python-style variable name (e.g. "plant.y")
+            times: Time vector
+            values: State values array
+            state_names: List of state names
+            sys_name: Julia variable name for the system
+            system_name: Python system name
+            params_dict: Parameter values used for the run
+
+        Returns:
+            Values of the variable at every saved time point (zeros if not found)
+        """
+        try:
+            # First, try to get the observed equation RHS for this variable
+            # This will help us compute parametric expressions correctly
+            observed_rhs = self._get_observed_rhs(var_name, sys_name, system_name)
 
-        for probe_name, probe in probes_dict.items():
-            probe_vars = {}
+            if observed_rhs is not None:
+                # Variable is an observed variable with an expression
+                # Try to evaluate it in Python to handle parameters correctly
+                print(f"Info: '{var_name}' is observed variable with RHS: {observed_rhs}")
 
-            for var_name, custom_name in zip(probe.variables, probe.names):
                 try:
-                    # First, try to get the observed equation RHS for this variable
-                    # This will help us compute parametric expressions correctly
-                    observed_rhs = self._get_observed_rhs(var_name, sys_name, system_name)
-
-                    if observed_rhs is not None:
-                        # Variable is an observed variable with an expression
-                        # Try to evaluate it in Python to handle parameters correctly
-                        print(f"Info: '{var_name}' is observed variable with RHS: {observed_rhs}")
-
-                        try:
-                            # Evaluate using Python expression parser
-                            extracted_values = self._evaluate_observed_expression(
-                                observed_rhs, times, values, state_names, params_dict
-                            )
-                            probe_vars[custom_name] = extracted_values
-                            print(f"Info: Successfully evaluated '{var_name}' using Python expression parser")
-                            continue  # Skip Julia extraction
-                        except Exception as e:
-                            print(f"Warning: Failed to evaluate observed expression in Python: {e}")
-                            print(f"  Falling back to Julia extraction...")
-
-                    # Convert Python variable name to Julia format (replace . with ₊)
-                    julia_var_name = var_name.replace(".", "₊")
-
-                    # Enhanced extraction code that searches in multiple locations
-                    # Initialize the output variable globally first
-                    self._jl.seval(f"_probe_values_{system_name} = Float64[]")
-
-                    extract_code = f"""
-                    let
-                        # Get the symbolic variable
-                        var_sym = Symbol("{julia_var_name}")
-
-                        # Collect all possible variables from the system
-                        # 1. Get unknowns (differential states after simplification)
-                        sys_unknowns = unknowns({sys_name})
-
-                        # 2. Get observables (algebraic variables and outputs)
-                        sys_observables = try
-                            observed({sys_name})
-                        catch
-                            []
-                        end
+                    # Evaluate using Python expression parser
+                    extracted_values = self._evaluate_observed_expression(
+                        observed_rhs, times, values, state_names, params_dict
+                    )
+                    print(f"Info: Successfully evaluated '{var_name}' using Python expression parser")
+                    return extracted_values
+                except Exception as e:
+                    print(f"Warning: Failed to evaluate observed expression in Python: {e}")
+                    print(f"  Falling back to Julia extraction...")
 
-                        # 3. Combine all variables
-                        all_vars = vcat(sys_unknowns, sys_observables)
-
-                        # Find matching variable (try multiple matching strategies)
-                        target_var = nothing
-                        is_observable = false
-
-                        # Strategy 1: Exact match after removing (t) suffix
-                        for v in all_vars
-                            v_str = replace(string(v), "(t)" => "")
-                            if Symbol(v_str) == var_sym
-                                target_var = v
-                                # Check if this is an observable
-                                is_observable = v in sys_observables
-                                break
-                            end
-                        end
+            # Convert Python variable name to Julia format (replace . with ₊)
+            julia_var_name = var_name.replace(".", "₊")
 
-                        # Strategy 2: Match with converted name (. to ₊)
-                        if target_var === nothing
-                            for v in all_vars
-                                v_str = replace(string(v), "(t)" => "")
-                                v_converted = replace(v_str, "₊" => ".")
-                                if v_converted == "{var_name}"
-                                    target_var = v
-                                    is_observable = v in sys_observables
-                                    break
-                                end
-                            end
+            # Enhanced extraction code that searches in multiple locations
+            # Initialize the output variable globally first
+            self._jl.seval(f"_probe_values_{system_name} = Float64[]")
+
+            extract_code = f"""
+            let
+                # Get the symbolic variable
+                var_sym = Symbol("{julia_var_name}")
+
+                # Collect all possible variables from the system
+                # 1. Get unknowns (differential states after simplification)
+                sys_unknowns = unknowns({sys_name})
+
+                # 2. Get observables (algebraic variables and outputs)
+                sys_observables = try
+                    observed({sys_name})
+                catch
+                    []
+                end
+
+                # 3. Combine all variables
+                all_vars = vcat(sys_unknowns, sys_observables)
+
+                # Find matching variable (try multiple matching strategies)
+                target_var = nothing
+                is_observable = false
+
+                # Strategy 1: Exact match after removing (t) suffix
+                for v in all_vars
+                    v_str = replace(string(v), "(t)" => "")
+                    if Symbol(v_str) == var_sym
+                        target_var = v
+                        # Check if this is an observable
+                        is_observable = v in sys_observables
+                        break
+                    end
+                end
+
+                # Strategy 2: Match with converted name (. to ₊)
+                if target_var === nothing
+                    for v in all_vars
+                        v_str = replace(string(v), "(t)" => "")
+                        v_converted = replace(v_str, "₊" => ".")
+                        if v_converted == "{var_name}"
+                            target_var = v
+                            is_observable = v in sys_observables
+                            break
                         end
+                    end
+                end
 
-                        # Strategy 3: Partial match (for simplified variable names)
-                        if target_var === nothing
-                            for v in all_vars
-                                v_str = replace(string(v), "(t)" => "")
-                                if contains(v_str, "{julia_var_name}") ||
-                                   contains("{julia_var_name}", v_str)
-                                    target_var = v
-                                    is_observable = v in sys_observables
-                                    break
-                                end
-                            end
+                # Strategy 3: Partial match (for simplified variable names)
+                if target_var === nothing
+                    for v in all_vars
+                        v_str = replace(string(v), "(t)" => "")
+                        if contains(v_str, "{julia_var_name}") ||
+                           contains("{julia_var_name}", v_str)
+                            target_var = v
+                            is_observable = v in sys_observables
+                            break
                         end
+                    end
+                end
 
-                        # Extract values from solution
-                        if target_var !== nothing
-                            try
-                                if is_observable
-                                    # For observables, we need to compute them from the solution
-                                    # Observables in ModelingToolkit are stored as Equation objects (lhs ~ rhs)
-                                    # BUGFIX: Need to evaluate the RHS expression, not just extract LHS
-                                    # because RHS may contain parameters (e.g., y ~ k*x where k is a parameter)
+                # Extract values from solution
+                if target_var !== nothing
+                    try
+                        if is_observable
+                            # For observables, we need to compute them from the solution
+                            # Observables in ModelingToolkit are stored as Equation objects (lhs ~ rhs)
+                            # BUGFIX: Need to evaluate the RHS expression, not just extract LHS
+                            # because RHS may contain parameters (e.g., y ~ k*x where k is a parameter)
 
-                                    # Get both lhs and rhs of the equation
-                                    obs_lhs = target_var.lhs
-                                    obs_rhs = target_var.rhs
+                            # Get both lhs and rhs of the equation
+                            obs_lhs = target_var.lhs
+                            obs_rhs = target_var.rhs
 
-                                    # Try to substitute values and evaluate the RHS expression
+                            # Try to substitute values and evaluate the RHS expression
+                            try
+                                # Method 1: Manually substitute and evaluate RHS
+                                # Create a function to evaluate RHS at each time point
+                                global _probe_values_{system_name} = []
+                                for i in 1:length(_sol_{system_name}.t)
+                                    # Get current state and parameters
+                                    current_state = _sol_{system_name}.u[i]
+                                    current_t = _sol_{system_name}.t[i]
+
+                                    # Try to evaluate the RHS by substituting current values
                                     try
-                                        # Method 1: Manually substitute and evaluate RHS
-                                        # Create a function to evaluate RHS at each time point
-                                        global _probe_values_{system_name} = []
-                                        for i in 1:length(_sol_{system_name}.t)
-                                            # Get current state and parameters
-                                            current_state = _sol_{system_name}.u[i]
-                                            current_t = _sol_{system_name}.t[i]
-
-                                            # Try to evaluate the RHS by substituting current values
-                                            try
-                                                # Use ModelingToolkit's substitute to evaluate RHS
-                                                val = ModelingToolkit.substitute(obs_rhs,
-                                                    ModelingToolkit.build_variable_subst_dict(_sol_{system_name}, i, _sol_{system_name}.prob.p))
-                                                push!(_probe_values_{system_name}, val)
-                                            catch
-                                                # Fallback: just use lhs value
-                                                val = _sol_{system_name}(current_t, idxs=obs_lhs)
-                                                push!(_probe_values_{system_name}, val)
-                                            end
-                                        end
-                                    catch e
-                                        # Fallback: use original method (may be wrong for parametric observables)
-                                        global _probe_values_{system_name} = [_sol_{system_name}(t, idxs=obs_lhs) for t in _sol_{system_name}.t]
+                                        # Use ModelingToolkit's substitute to evaluate RHS
+                                        val = ModelingToolkit.substitute(obs_rhs,
+                                            ModelingToolkit.build_variable_subst_dict(_sol_{system_name}, i, _sol_{system_name}.prob.p))
+                                        push!(_probe_values_{system_name}, val)
+                                    catch
+                                        # Fallback: just use lhs value
+                                        val = _sol_{system_name}(current_t, idxs=obs_lhs)
+                                        push!(_probe_values_{system_name}, val)
                                     end
-                                else
-                                    # For unknowns (differential states), use direct indexing
-                                    global _probe_values_{system_name} = [_sol_{system_name}[target_var, i] for i in 1:length(_sol_{system_name}.t)]
                                 end
                             catch e
-                                # Fallback: try alternative methods
-                                try
-                                    # Try using sol(t, idxs=var) for all variables
-                                    global _probe_values_{system_name} = [_sol_{system_name}(t, idxs=target_var) for t in _sol_{system_name}.t]
-                                catch e2
-                                    # If that fails too, try to find in unknowns by index
-                                    var_idx = findfirst(x -> x == target_var, sys_unknowns)
-                                    if var_idx !== nothing
-                                        global _probe_values_{system_name} = [_sol_{system_name}.u[i][var_idx] for i in 1:length(_sol_{system_name}.t)]
-                                    else
-                                        global _probe_values_{system_name} = zeros(length(_sol_{system_name}.t))
-                                    end
-                                end
+                                # Fallback: use original method (may be wrong for parametric observables)
+                                global _probe_values_{system_name} = [_sol_{system_name}(t, idxs=obs_lhs) for t in _sol_{system_name}.t]
                             end
                         else
-                            # Variable not found after all strategies
-                            global _probe_values_{system_name} = zeros(length(_sol_{system_name}.t))
+                            # For unknowns (differential states), use direct indexing
+                            global _probe_values_{system_name} = [_sol_{system_name}[target_var, i] for i in 1:length(_sol_{system_name}.t)]
+                        end
+                    catch e
+                        # Fallback: try alternative methods
+                        try
+                            # Try using sol(t, idxs=var) for all variables
+                            global _probe_values_{system_name} = [_sol_{system_name}(t, idxs=target_var) for t in _sol_{system_name}.t]
+                        catch e2
+                            # If that fails too, try to find in unknowns by index
+                            var_idx = findfirst(x -> x == target_var, sys_unknowns)
+                            if var_idx !== nothing
+                                global _probe_values_{system_name} = [_sol_{system_name}.u[i][var_idx] for i in 1:length(_sol_{system_name}.t)]
+                            else
+                                global _probe_values_{system_name} = zeros(length(_sol_{system_name}.t))
+                            end
                         end
                     end
-                    """
+                else
+                    # Variable not found after all strategies
+                    global _probe_values_{system_name} = zeros(length(_sol_{system_name}.t))
+                end
+            end
+            """
+
+            self._jl.seval(extract_code)
 
-                    self._jl.seval(extract_code)
+            # Get the extracted values
+            values_jl = self._jl.seval(f"_probe_values_{system_name}")
+            extracted_values = np.array(values_jl)
 
-                    # Get the extracted values
-                    values_jl = self._jl.seval(f"_probe_values_{system_name}")
-                    extracted_values = np.array(values_jl)
+            # Check if values are valid (not all zeros when they shouldn't be)
+            if np.allclose(extracted_values, 0.0) and var_name in state_names:
+                # Try direct extraction from values array if variable is in state_names
+                try:
+                    idx = state_names.index(var_name)
+                    extracted_values = values[:, idx].copy()
+                    print(f"Info: Using direct state extraction for '{var_name}'")
+                except (ValueError, IndexError):
+                    pass  # Keep zeros if direct extraction fails
 
-                    # Check if values are valid (not all zeros when they shouldn't be)
-                    if np.allclose(extracted_values, 0.0) and var_name in state_names:
-                        # Try direct extraction from values array if variable is in state_names
-                        try:
-                            idx = state_names.index(var_name)
-                            extracted_values = values[:, idx].copy()
-                            print(f"Info: Using direct state extraction for '{var_name}'")
-                        except (ValueError, IndexError):
-                            pass  # Keep zeros if direct extraction fails
+            return extracted_values
 
-                    probe_vars[custom_name] = extracted_values
+        except Exception as e:
+            # If extraction fails, warn but continue
+            print(f"Warning: Failed to extract probe variable '{var_name}': {e}")
+            print(f"  Suggestion: Use result.state_names to see available variables")
+            # Fill with zeros
+            return np.zeros(len(times))
 
-                except Exception as e:
-                    # If extraction fails, warn but continue
-                    print(f"Warning: Failed to extract probe variable '{var_name}': {e}")
-                    print(f"  Suggestion: Use result.state_names to see available variables")
-                    # Fill with zeros
-                    probe_vars[custom_name] = np.zeros(len(times))
+    def _extract_observed_values(
+        self,
+        var_names: List[str],
+        sys_name: str,
+        system_name: str
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluate observed variables of the solution in a single Julia call.
 
-            probe_data[probe_name] = probe_vars
+        Names are looked up in a name -> variable Dict built once from
+        observed(sys), and sol[var] evaluates each observed equation (including
+        its parameters) at every saved time point. The columns come back as one
+        (n_timepoints, n_vars) matrix.
 
-        return probe_data
+        Args:
+            var_names: Python-style names (e.g. "plant.y") of non-state variables
+            sys_name: Julia variable name for the system
+            system_name: Python system name
+
+        Returns:
+            Dictionary of {var_name: values} for the names that were found;
+            missing names (or a failed evaluation) are left to the caller's fallback
+        """
+        if not var_names:
+            return {}
+
+        try:
+            setattr(
+                self._jl, f"_probe_names_{system_name}",
+                [name.replace(".", "₊") for name in var_names]
+            )
+            self._jl.seval(f"""
+            let obs_vars = Dict(string(ModelingToolkit.getname(eq.lhs)) => eq.lhs
+                                for eq in observed({sys_name})),
+                names = PythonCall.pyconvert(Vector{{String}}, _probe_names_{system_name}),
+                n_t = length(_sol_{system_name}.t)
+
+                # Fill a pre-sized matrix column by column (no per-variable
+                # vectors to stack afterwards)
+                M = Matrix{{Float64}}(undef, n_t, length(names))
+                for (j, n) in enumerate(names)
+                    if haskey(obs_vars, n)
+                        M[:, j] .= _sol_{system_name}[obs_vars[n]]
+                    else
+                        M[:, j] .= 0.0
+                    end
+                end
+                global _probe_found_{system_name} = [haskey(obs_vars, n) for n in names]
+                global _probe_matrix_{system_name} = M
+            end
+            """)
+            found = list(self._jl.seval(f"_probe_found_{system_name}"))
+            matrix = np.asarray(self._jl.seval(f"_probe_matrix_{system_name}"))
+        except Exception as e:
+            print(f"Warning: Batched observed extraction failed, extracting one by one: {e}")
+            return {}
+
+        return {
+            name: matrix[:, i]
+            for i, (name, is_found) in enumerate(zip(var_names, found))
+            if is_found
+        }
 
     def _build_callbacks(
         self,
         events: List[Union[TimeEvent, ContinuousEvent]],
-        system_name: str
-    ) -> List[str]:
+        system_name: str,
+        save_positions: bool = True
+    ) -> Tuple[List[Any], List[Any]]:
         """
         Build Julia callbacks from Python events.
 
         Converts TimeEvent and ContinuousEvent objects into Julia PresetTimeCallback
-        and ContinuousCallback objects.
+        and ContinuousCallback objects. Callbacks are memoized per event object, so
+        repeated runs reuse the Julia functions generated for an event instead of
+        redefining (and recompiling) them; the memo is reset when the system is
+        recompiled. The callbacks are held only by this memo (no Julia globals),
+        so they are freed with the simulator or when the memo is reset.
 
         Args:
             events: List of event objects
-            system_name: Name of the system (for unique Julia variable naming)
+            system_name: Name of the system
+            save_positions: Save the state around each event (see _callback_kwarg())
 
         Returns:
-            List of Julia callback variable names
+            Tuple of (continuous, discrete) lists of Julia callback objects
 
         Note:
-            Python callbacks are stored in Julia via PythonCall.jl and invoked
-            from Julia's callback functions.
+            Python callbacks are captured by Julia closures via PythonCall.jl
+            and invoked from Julia's callback functions.
         """
-        callback_names = []
+        if (self._callback_version != self.system._compile_version
+                or self._event_params is None):
+            self._callback_cache = {}
+            self._callback_version = self.system._compile_version
+
+            # Parameter tables shared by this simulator's event affects:
+            # symbols maps Python names to Julia Symbols (so names are not re-mangled
+            # on every fire; only names found here can be updated by events), and
+            # setters caches the setter resolved for each name on first use
+            self._event_params = self._jl.seval(
+                f"(symbols = Dict{{String, Symbol}}("
+                f'replace(string(p), "₊" => ".") => Symbol(string(p)) '
+                f"for p in parameters(_sys_{system_name})), "
+                f"setters = Dict{{String, Any}}())"
+            )
+
+        continuous_callbacks = []
+        discrete_callbacks = []
 
-        for idx, event in enumerate(events):
-            if isinstance(event, TimeEvent):
-                # Build PresetTimeCallback
-                callback_name = self._build_time_callback(event, idx, system_name)
-                callback_names.append(callback_name)
+        for event in events:
+            cache_key = (id(event), save_positions)
+            cached = self._callback_cache.get(cache_key)
+            if cached is not None and cached[0] is event:
+                callback = cached[1]
+            else:
+                if isinstance(event, TimeEvent):
+                    # Build PresetTimeCallback
+                    callback = self._build_time_callback(event, system_name, save_positions)
+                elif isinstance(event, ContinuousEvent):
+                    # Build ContinuousCallback
+                    callback = self._build_continuous_callback(
+                        event, system_name, save_positions
+                    )
+                else:
+                    continue
+                self._callback_cache[cache_key] = (event, callback)
 
-            elif isinstance(event, ContinuousEvent):
-                # Build ContinuousCallback
-                callback_name = self._build_continuous_callback(event, idx, system_name)
-                callback_names.append(callback_name)
+            if isinstance(event, ContinuousEvent):
+                continuous_callbacks.append(callback)
+            else:
+                discrete_callbacks.append(callback)
 
-        return callback_names
+        return continuous_callbacks, discrete_callbacks
 
     def _build_time_callback(
         self,
         event: TimeEvent,
-        idx: int,
-        system_name: str
-    ) -> str:
+        system_name: str,
+        save_positions: bool = True
+    ) -> Any:
         """
         Build a Julia PresetTimeCallback from a TimeEvent.
 
         Args:
             event: TimeEvent instance
-            idx: Index of the event (for unique naming)
             system_name: System name
+            save_positions: Save the state just before and after the event
 
         Returns:
-            Julia variable name for the callback
-        """
-        callback_var = f"_time_callback_{system_name}_{idx}"
-
-        # Store the Python callback function in Julia
-        py_callback_var = f"_py_time_affect_{system_name}_{idx}"
-        self._jl.seval(f"{py_callback_var} = pyimport(\"builtins\").None")
-
-        # We need to pass the Python function to Julia
-        # Use PythonCall to wrap the function
-        import juliacall
-        self._jl.seval(f"import PythonCall")
-
-        # Create a wrapper function that stores parameter updates
-        # Python callback returns dict of parameter changes
-        self._jl.seval(f"""
-        {py_callback_var} = nothing
-        """)
-
-        # Store the callback in a global Julia variable accessible from Python
-        setattr(self._jl, f"_py_cb_{system_name}_{idx}", event.callback)
-
-        # Create Julia affect function that calls the Python callback
-        # and updates the integrator parameters
-        affect_code = f"""
-        function _affect_time_{system_name}_{idx}(integrator)
-            # Call Python callback to get parameter updates
-            py_callback = Main._py_cb_{system_name}_{idx}
-            param_updates = PythonCall.pyconvert(Dict, py_callback(integrator))
-
-            # Apply parameter updates
-            for (param_name, new_value) in param_updates
-                # Convert Python name (e.g., "module.param") to Julia symbol
-                param_name_jl = replace(param_name, "." => "₊")
-                param_sym = Symbol(param_name_jl)
-
-                # Update the parameter using try-catch to handle missing parameters gracefully
-                try
-                    integrator.ps[param_sym] = new_value
-                catch e
-                    @warn "Failed to update parameter $param_name_jl: $e"
-                end
-            end
-        end
+            The Julia callback object
         """
-        self._jl.seval(affect_code)
-
-        # Create PresetTimeCallback
-        preset_callback_code = f"""
-        {callback_var} = PresetTimeCallback(
-            [{event.time}],
-            _affect_time_{system_name}_{idx}
-        )
-        """
-        self._jl.seval(preset_callback_code)
-
-        return callback_var
+        affect = self._define_affect(event.callback, system_name)
+        return self._jl.seval(
+            "(t, affect, save) -> PresetTimeCallback([t], affect; save_positions=(save, save))"
+        )(float(event.time), affect, save_positions)
 
     def _build_continuous_callback(
         self,
         event: ContinuousEvent,
-        idx: int,
-        system_name: str
-    ) -> str:
+        system_name: str,
+        save_positions: bool = True
+    ) -> Any:
         """
         Build a Julia ContinuousCallback from a ContinuousEvent.
 
         Args:
             event: ContinuousEvent instance
-            idx: Index of the event (for unique naming)
             system_name: System name
+            save_positions: Save the state just before and after the event
 
         Returns:
-            Julia variable name for the callback
-        """
-        callback_var = f"_continuous_callback_{system_name}_{idx}"
-
-        # Store the Python callback functions in Julia-accessible variables
-        setattr(self._jl, f"_py_cond_{system_name}_{idx}", event.condition)
-        setattr(self._jl, f"_py_affect_{system_name}_{idx}", event.affect)
-
-        # Create Julia condition function that calls the Python condition
-        condition_code = f"""
-        function _condition_{system_name}_{idx}(u, t, integrator)
-            # Call Python condition function
-            py_condition = Main._py_cond_{system_name}_{idx}
-            result = PythonCall.pyconvert(Float64, py_condition(u, t, integrator))
-            return result
-        end
-        """
-        self._jl.seval(condition_code)
-
-        # Create Julia affect function that calls the Python affect
-        affect_code = f"""
-        function _affect_{system_name}_{idx}(integrator)
-            # Call Python affect function to get parameter updates
-            py_affect = Main._py_affect_{system_name}_{idx}
-            param_updates = PythonCall.pyconvert(Dict, py_affect(integrator))
-
-            # Apply parameter updates
-            for (param_name, new_value) in param_updates
-                # Convert Python name to Julia symbol
-                param_name_jl = replace(param_name, "." => "₊")
-                param_sym = Symbol(param_name_jl)
-
-                # Update the parameter using try-catch to handle missing parameters gracefully
-                try
-                    integrator.ps[param_sym] = new_value
-                catch e
-                    @warn "Failed to update parameter $param_name_jl: $e"
-                end
-            end
-        end
-        """
-        self._jl.seval(affect_code)
-
-        # Map direction to Julia notation
-        # 0 = both, +1 = upcrossing, -1 = downcrossing
-        if event.direction == 0:
-            rootfind_str = "SciMLBase.RightRootFind"
-        elif event.direction == 1:
-            rootfind_str = "SciMLBase.LeftRootFind"
-        else:  # -1
-            rootfind_str = "SciMLBase.RightRootFind"
-
-        # Create ContinuousCallback
-        continuous_callback_code = f"""
-        {callback_var} = ContinuousCallback(
-            _condition_{system_name}_{idx},
-            _affect_{system_name}_{idx},
-            rootfind={rootfind_str}
+            The Julia callback object
+        """
+        if isinstance(event.condition, str):
+            # Native Julia condition: no Python call during root finding
+            condition_expr = self._condition_to_julia(event.condition, system_name)
+            condition = self._jl.seval(f"(u, t, integrator) -> {condition_expr}")
+        else:
+            # Closure over the generic _eval_py_condition (defined once by the backend)
+            condition = self._jl.seval("_py_condition")(event.condition)
+
+        affect = self._define_affect(event.affect, system_name)
+
+        # The backend maps direction onto ContinuousCallback's affect!/affect_neg!
+        # slots, so the solver itself gates which crossings fire
+        return self._jl.seval("_continuous_callback")(
+            condition, affect, event.direction, save_positions
         )
+
+    def _define_affect(
+        self,
+        action: Union[Dict[str, float], Callable],
+        system_name: str
+    ) -> Any:
+        """
+        Build a Julia affect!(integrator) closure for an event action.
+
+        A dict of parameter changes is resolved to parameter indices once, here,
+        and applied by a single indexed setter without calling back into Python;
+        a Python function is captured by the closure and called when the event
+        fires. Both are built from generic helpers defined by the backend.
+
+        Args:
+            action: Dict {param_name: new_value} or function (integrator) -> dict
+            system_name: System name
+
+        Returns:
+            The Julia affect! function
+        """
+        if isinstance(action, dict):
+            # repr() of a float is a valid Julia literal except for inf/nan
+            pairs = ", ".join(
+                f'"{name}" => {repr(float(value)).replace("inf", "Inf").replace("nan", "NaN")}'
+                for name, value in action.items()
+            )
+            return self._jl.seval(
+                f"event_params -> _param_updates_affect("
+                f"_sys_{system_name}, Dict{{String, Float64}}({pairs}), event_params)"
+            )(self._event_params)
+        return self._jl.seval("_py_affect")(action, self._event_params)
+
+    def _condition_to_julia(self, expr: str, system_name: str) -> str:
         """
-        self._jl.seval(continuous_callback_code)
+        Translate a condition expression into Julia code over the state vector.
 
-        return callback_var
+        Dotted names whose first segment is a module of the system (e.g.
+        "tank.level") are replaced with u[i] using the order of unknowns in the
+        simplified system; everything else, including module-qualified Julia
+        calls such as Base.sin(t), is passed through as Julia code. Only
+        unknowns of the simplified system can be referenced: observed
+        variables eliminated by structural_simplify are rejected.
+
+        Args:
+            expr: Condition expression, e.g. "tank.level - 2.0"
+            system_name: System name
+
+        Returns:
+            Julia expression string, e.g. "u[3] - 2.0"
+
+        Raises:
+            ValueError: If a name under a system module is not a state of the
+                simplified system
+        """
+        state_index = self._state_index
+        module_names = {module.name for module in self.system._modules}
+
+        def replace_name(match: "re.Match") -> str:
+            name = match.group(0)
+            if name.split(".", 1)[0] not in module_names:
+                return name
+            if name not in state_index:
+                raise ValueError(
+                    f"Unknown state '{name}' in event condition '{expr}'. "
+                    f"Only states of the simplified system can be used "
+                    f"(observed variables are not available). "
+                    f"Available states: {self._state_names or []}"
+                )
+            # Julia indexing is 1-based
+            return f"u[{state_index[name] + 1}]"
+
+        return _STATE_NAME_RE.sub(replace_name, expr)
 
     def run_to_dict(
         self,
@@ -802,38 +1220,121 @@ class Simulator:
             >>> import matplotlib.pyplot as plt
             >>> plt.plot(results['t'], results['rc_circuit__V'])
         """
-        times, values = self.run(t_span, u0, params, dt, solver)
+        sim_result = self.run(t_span, u0, params, dt, solver)
+        times, values = sim_result.times, sim_result.values
 
-        # Get state names from the simplified system
-        try:
-            # Get unknowns from the system
-            sys_name = f"_sys_{self.system.name}"
-            unknowns_jl = self._jl.seval(f"unknowns({sys_name})")
-
-            # Extract state names and convert ₊ to _ to avoid encoding issues
-            state_names = []
-            for i in range(len(unknowns_jl)):
-                var = unknowns_jl[i]
-                # Convert Julia variable to string
-                var_str = self._jl.seval(f"string(unknowns({sys_name})[{i+1}])")
-                # Remove (t) suffix if present
-                if "(t)" in var_str:
-                    var_str = var_str.replace("(t)", "")
-                # Convert ₊ to __ for Python compatibility (avoid Unicode encoding issues)
-                var_str = var_str.replace("₊", "__")
-                state_names.append(var_str)
-
-        except Exception:
-            # Fallback: use generic names
-            state_names = [f"state_{i}" for i in range(values.shape[1])]
+        # run() already fetched the state names in one Julia call; convert the
+        # Python-style "." separator (Julia ₊) to __ to avoid encoding issues
+        state_names = [name.replace(".", "__") for name in sim_result.state_names]
 
-        # Build result dictionary
+        # Build result dictionary; values is column-major, so each entry is a
+        # contiguous view of its column rather than a copy
         result = {"t": times}
-        for i, name in enumerate(state_names):
-            result[name] = values[:, i]
+        result.update(zip(state_names, values.T))
 
         return result
 
+    def run_batch(
+        self,
+        t_span: Tuple[float, float],
+        param_sets: List[Dict[str, float]],
+        dt: float,
+        u0: Optional[Dict[str, float]] = None,
+        solver: str = "Rodas5",
+        jac: bool = False,
+        sparse: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate several parameter scenarios in one Julia EnsembleProblem.
+
+        The ODEProblem is built (or reused) once; each trajectory remakes it with
+        its own parameter values, and the whole batch is solved by one solve()
+        call. Without events the trajectories run on Julia threads
+        (EnsembleThreads, start Julia with JULIA_NUM_THREADS > 1); systems with
+        events are solved serially, since Python event callbacks must not be
+        called from several threads. Events do not add save points here, so
+        every scenario is saved on the same dt grid.
+
+        Args:
+            t_span: Time span tuple (t_start, t_end)
+            param_sets: One dict of parameter overrides per scenario, e.g.
+                [{"pid.Kp": 1.0}, {"pid.Kp": 2.0}]; unlisted parameters keep
+                their module defaults
+            dt: Time step for saving solution points (shared by all scenarios)
+            u0: Optional dict of initial conditions shared by all scenarios
+            solver: Solver name (default: "Rodas5"), or "auto"
+            jac, sparse: ODEProblem options, see run()
+
+        Returns:
+            Tuple of (times, values):
+                - times: 1D numpy array of time points
+                - values: 3D numpy array (n_scenarios, n_timepoints, n_states)
+
+        Raises:
+            ValueError: If t_span is invalid or param_sets is empty
+            RuntimeError: If solving fails
+
+        Example:
+            >>> gains = [1.0, 2.0, 4.0]
+            >>> times, values = sim.run_batch(
+            ...     (0.0, 10.0), [{"pid.Kp": kp} for kp in gains], dt=0.1
+            ... )
+            >>> values.shape  # (3, 101, n_states)
+        """
+        if len(t_span) != 2 or t_span[0] >= t_span[1]:
+            raise ValueError(f"t_span must be (t_start, t_end) with t_start < t_end, got {t_span}")
+        if not param_sets:
+            raise ValueError("param_sets must contain at least one scenario")
+
+        try:
+            self._prepare_problem(t_span, u0, None, jac, sparse, False)
+
+            # Full parameter table: defaults overridden per scenario, one row each
+            defaults = {
+                f"{module.name}.{param_name}": default_val
+                for module in self.system._modules
+                for param_name, default_val in module._params.items()
+            }
+            for overrides in param_sets:
+                for name in overrides:
+                    defaults.setdefault(name, 1.0)
+            names = list(defaults)
+            table = np.array(
+                [[overrides.get(name, defaults[name]) for name in names]
+                 for overrides in param_sets],
+                dtype=np.float64
+            )
+
+            solve_kwargs = [f"saveat={dt}"]
+            # Events must not add save points, or trajectories whose events fire
+            # at different times would not share one time grid
+            callback_kwarg = self._callback_kwarg(save_positions=False)
+            if callback_kwarg is not None:
+                solve_kwargs.append(callback_kwarg)
+            ensemble = "EnsembleSerial()" if self.system._events else "EnsembleThreads()"
+            if solver == "auto":
+                solver_expr = f"_auto_solver(_prob_{self.system.name})"
+            else:
+                solver_expr = f"{solver}()"
+
+            setattr(self._jl, f"_batch_names_{self.system.name}",
+                    [name.replace(".", "₊") for name in names])
+            setattr(self._jl, f"_batch_table_{self.system.name}", table)
+            times_jl, values_jl = self._jl.seval(
+                f"_solve_ensemble(_prob_{self.system.name}, _params_{self.system.name}, "
+                f"Symbol.(PythonCall.pyconvert(Vector{{String}}, _batch_names_{self.system.name})), "
+                f"PythonCall.pyconvert(Matrix{{Float64}}, _batch_table_{self.system.name}), "
+                f"{solver_expr}, {ensemble}; {', '.join(solve_kwargs)})"
+            )
+
+            # values_jl is a Julia Array{Float64, 3}; wrap it without copying
+            return np.asarray(times_jl), np.asarray(values_jl)
+
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to run batch simulation of system '{self.system.name}': {e}"
+            ) from e
+
     def _get_observed_rhs(self, var_name: str, sys_name: str, system_name: str) -> Optional[str]:
         """
         Get the RHS expression of an observed variable.
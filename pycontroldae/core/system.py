@@ -10,13 +10,34 @@ Enhanced features:
 - Event system for time-based and condition-based callbacks
 """
 
-from typing import List, Any, Optional, Union, Tuple
+import hashlib
+import os
+from typing import List, Any, Iterable, Optional, Union, Tuple
 from .backend import get_jl
 from .module import Module
 from .port import Port, Connection
 from .events import TimeEvent, ContinuousEvent
 
 
+def _module_signature(module: Module) -> Tuple:
+    """
+    Structural signature of a module: names, equations and (for composite
+    modules) sub-modules, connections and exposed interfaces. Numeric default
+    values are not included since they are supplied at simulation time.
+    """
+    return (
+        type(module).__name__,
+        module.name,
+        tuple(module._states.keys()),
+        tuple(module._params.keys()),
+        tuple(module._equations),
+        tuple(_module_signature(m) for m in getattr(module, "_modules", [])),
+        tuple(getattr(module, "_connections", [])),
+        tuple(sorted(getattr(module, "_input_interfaces", {}).items())),
+        tuple(sorted(getattr(module, "_output_interfaces", {}).items())),
+    )
+
+
 class System:
     """
     A system that composes multiple modules with connections.
@@ -55,6 +76,7 @@ class System:
         self._modules: List[Module] = []
         self._connections: List[str] = []
         self._compiled_system: Optional[Any] = None
+        self._compile_version = 0  # Incremented by every compile()
         self._events: List[Union[TimeEvent, ContinuousEvent]] = []
 
     def add_module(self, module: Module) -> 'System':
@@ -76,6 +98,30 @@ class System:
         self._modules.append(module)
         return self
 
+    def add_modules(self, modules: Iterable[Module]) -> 'System':
+        """
+        Add several modules at once.
+
+        Args:
+            modules: Iterable of Module instances
+
+        Returns:
+            self (for method chaining)
+
+        Raises:
+            TypeError: If any item is not a Module instance
+
+        Example:
+            >>> system.add_modules([setpoint, pid, plant])
+        """
+        modules = list(modules)
+        for module in modules:
+            if not isinstance(module, Module):
+                raise TypeError(f"Expected Module instance, got {type(module)}")
+
+        self._modules.extend(modules)
+        return self
+
     def connect(self, connection: Union[str, Connection, Tuple[Module, Module, str]]) -> 'System':
         """
         Add a connection between module variables.
@@ -132,6 +178,37 @@ class System:
 
         return self
 
+    def connect_many(
+        self,
+        connections: Iterable[Union[str, Connection, Tuple[Module, Module, str]]]
+    ) -> 'System':
+        """
+        Add several connections at once.
+
+        Each item accepts the same formats as connect(). Connections are only
+        recorded here; compile() sends all of them to Julia in a single
+        equation vector.
+
+        Args:
+            connections: Iterable of connection strings, Connection objects or tuples
+
+        Returns:
+            self (for method chaining)
+
+        Raises:
+            TypeError: If any connection format is invalid
+
+        Example:
+            >>> system.connect_many([
+            ...     "sp.signal ~ error.input1",
+            ...     plant.y1 >> error.input2,
+            ...     error.output >> pid.error,
+            ... ])
+        """
+        for connection in connections:
+            self.connect(connection)
+        return self
+
     def add_event(self, event: Union[TimeEvent, ContinuousEvent]) -> 'System':
         """
         Add an event to the system.
@@ -185,7 +262,21 @@ class System:
         """Get the list of registered events."""
         return self._events.copy()
 
-    def compile(self) -> Any:
+    def _structure_key(self) -> str:
+        """
+        Hash of the system topology (modules, equations, connections).
+
+        Two systems with the same key produce the same simplified ODESystem,
+        regardless of their numeric state/parameter defaults.
+        """
+        signature = (
+            self.name,
+            tuple(_module_signature(m) for m in self._modules),
+            tuple(self._connections),
+        )
+        return hashlib.blake2b(repr(signature).encode("utf-8"), digest_size=16).hexdigest()
+
+    def compile(self, use_cache: bool = True, cache_dir: Optional[str] = None) -> Any:
         """
         Compile the system into a simplified Julia ODESystem.
 
@@ -195,6 +286,28 @@ class System:
         3. Applies structural_simplify (CRITICAL for DAE index reduction)
         4. Returns the simplified Julia ODESystem
 
+        The simplified system is cached in the Julia session keyed by a hash of
+        the system topology, so compiling an identical system again (e.g. when a
+        script rebuilds the same model, or only numeric defaults changed) skips
+        composition and structural_simplify.
+
+        With cache_dir set, the simplified system is also serialized to
+        "<cache_dir>/julia-<version>_mtk-<version>/<topology hash>.jls" and
+        loaded from there by later Python sessions. The Serialization format is
+        not stable across Julia or ModelingToolkit versions, so each version
+        pair gets its own subdirectory; an unreadable file is ignored and
+        rebuilt. Setting the PYCONTROLDAE_CACHE_DIR environment variable enables
+        the same versioned disk cache for every compile() without a cache_dir
+        argument (and with use_cache left on). Numeric defaults are not part of
+        the key, so gain or setpoint changes still hit the cache.
+
+        Args:
+            use_cache: Reuse a previously simplified system with the same
+                topology if available (default: True)
+            cache_dir: Directory for the on-disk cache, e.g. ".pcdae_cache"
+                (default: None, uses $PYCONTROLDAE_CACHE_DIR if set, otherwise
+                session cache only)
+
         Returns:
             A simplified Julia ODESystem object
 
@@ -215,12 +328,50 @@ class System:
 
         jl = get_jl()
 
+        if not use_cache:
+            cache_dir = None
+        elif cache_dir is None:
+            cache_dir = os.environ.get("PYCONTROLDAE_CACHE_DIR") or None
+        if cache_dir is not None:
+            # Files written by another Julia or ModelingToolkit version may
+            # deserialize into a broken system, so never share them
+            cache_dir = os.path.join(cache_dir, jl.seval(
+                'string("julia-", VERSION, "_mtk-", pkgversion(ModelingToolkit))'
+            ))
+
         try:
             # Build all modules if not already built
             for module in self._modules:
                 if module._julia_system is None:
                     module.build()
 
+            # Reuse a cached simplified system with the same topology
+            if use_cache:
+                key = self._structure_key()
+                if jl.seval(f'haskey(_compile_cache, "{key}")'):
+                    jl.seval(f'_simplified_{self.name} = _compile_cache["{key}"]')
+                    self._compiled_system = jl.seval(f"_simplified_{self.name}")
+                    self._compile_version += 1
+                    return self._compiled_system
+
+                # Try the on-disk cache from an earlier session
+                if cache_dir is not None:
+                    cache_file = os.path.join(cache_dir, f"{key}.jls")
+                    if os.path.exists(cache_file):
+                        try:
+                            loaded = jl.seval(
+                                f"path -> (global _simplified_{self.name} = "
+                                f"Serialization.deserialize(path)) isa "
+                                f"ModelingToolkit.AbstractSystem"
+                            )(cache_file)
+                        except Exception:
+                            loaded = False
+                        if loaded:  # Otherwise fall through and recompile
+                            jl.seval(f'_compile_cache["{key}"] = _simplified_{self.name}')
+                            self._compiled_system = jl.seval(f"_simplified_{self.name}")
+                            self._compile_version += 1
+                            return self._compiled_system
+
             # Get Julia system names
             systems_str = ", ".join([mod.name for mod in self._modules])
 
@@ -249,6 +400,17 @@ class System:
 
             # Retrieve and cache the simplified system
             self._compiled_system = jl.seval(f"_simplified_{self.name}")
+            self._compile_version += 1
+            if use_cache:
+                jl.seval(f'_compile_cache["{key}"] = _simplified_{self.name}')
+                if cache_dir is not None:
+                    try:
+                        os.makedirs(cache_dir, exist_ok=True)
+                        jl.seval(
+                            "(path, sys) -> Serialization.serialize(path, sys)"
+                        )(os.path.join(cache_dir, f"{key}.jls"), self._compiled_system)
+                    except Exception:
+                        pass  # The disk cache is best effort
 
             return self._compiled_system
 
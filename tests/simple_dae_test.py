@@ -5,15 +5,22 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import os
 import sys
-import io
 from pycontroldae.core import Module, System, Simulator, DataProbe
 from pycontroldae.blocks import Step
 
 # Set UTF-8 encoding for output
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+# 默认以二进制.npz保存数据；需要CSV时设为True
+SAVE_CSV = False
+
+# 图片分辨率（默认150 dpi，可通过PLOT_DPI覆盖）；设置PLOT_SHOW时弹出窗口
+DPI = int(os.environ.get('PLOT_DPI', '150'))
+PLOT_SHOW = bool(os.environ.get('PLOT_SHOW'))
 
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode MS']
 plt.rcParams['axes.unicode_minus'] = False
@@ -144,13 +151,13 @@ def run_simple_dae_test():
     result = simulator.run(
         t_span=(0.0, 2.0),
         dt=0.01,
-        solver="Rodas5"
+        solver="Rodas5",
+        jac=True
     )
 
     print("\n✓ 仿真完成！")
     print("\n系统状态变量:")
-    for name in result.state_names[:10]:  # 只显示前10个
-        print(f"  - {name}")
+    print("\n".join(f"  - {name}" for name in result.state_names[:10]))  # 只显示前10个
 
     # 打印统计
     result.print_summary()
@@ -169,67 +176,54 @@ def plot_simple_results(result):
 
     # 尝试获取关键变量
     try:
-        # 直接从状态名称获取
-        state_dict = {name: result.get_state(name) for name in result.state_names}
+        # (变量名, 线型, 图例, y轴标签, 标题)，依次对应四个子图
+        panels = [
+            ('input.signal', 'b-', '输入电压', '电压 (V)', '输入电压'),
+            ('rl.i', 'r-', '电路电流', '电流 (A)', '电路电流'),
+            ('cap.V', 'g-', '电容电压', '电压 (V)', '电容电压'),
+            ('rl.V_L', 'purple', '电感电压', '电压 (V)', '电感电压（代数约束）'),
+        ]
+
+        # 只取绘图需要的4个变量（代数变量可能已被structural_simplify消去）
+        wanted = [panel[0] for panel in panels]
+        available = set(result.state_names)
+        present = [name for name in wanted if name in available]
+        state_dict = dict(zip(present, result.get_states(present).T))
 
         fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 
-        # 1. 输入电压
-        ax = axes[0, 0]
-        if 'input.signal' in state_dict:
-            ax.plot(times, state_dict['input.signal'], 'b-', linewidth=2, label='输入电压')
-        ax.set_xlabel('时间 (s)')
-        ax.set_ylabel('电压 (V)')
-        ax.set_title('输入电压', fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-
-        # 2. 电流
-        ax = axes[0, 1]
-        if 'rl.i' in state_dict:
-            ax.plot(times, state_dict['rl.i'], 'r-', linewidth=2, label='电路电流')
-        ax.set_xlabel('时间 (s)')
-        ax.set_ylabel('电流 (A)')
-        ax.set_title('电路电流', fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-
-        # 3. 电容电压
-        ax = axes[1, 0]
-        if 'cap.V' in state_dict:
-            ax.plot(times, state_dict['cap.V'], 'g-', linewidth=2, label='电容电压')
-        ax.set_xlabel('时间 (s)')
-        ax.set_ylabel('电压 (V)')
-        ax.set_title('电容电压', fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-
-        # 4. 电感电压（代数变量）
-        ax = axes[1, 1]
-        if 'rl.V_L' in state_dict:
-            ax.plot(times, state_dict['rl.V_L'], 'purple', linewidth=2, label='电感电压')
-        ax.set_xlabel('时间 (s)')
-        ax.set_ylabel('电压 (V)')
-        ax.set_title('电感电压（代数约束）', fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
+        for ax, (name, style, label, ylabel, title) in zip(axes.flat, panels):
+            if name in state_dict:
+                ax.plot(times, state_dict[name], style, linewidth=2, label=label)
+            ax.set_ylabel(ylabel)
+            ax.set_title(title, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+            ax.legend()
+
+        plt.setp(axes.flat, xlabel='时间 (s)')
 
         plt.suptitle('RLC电路仿真 - 含代数约束的DAE系统', fontsize=14, fontweight='bold')
         plt.tight_layout()
 
         filename = 'simple_dae_rlc.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        plt.savefig(filename, dpi=DPI, bbox_inches='tight')
         print(f"✓ 图形已保存: {filename}")
 
-        plt.show()
+        if PLOT_SHOW:
+            plt.show()
+        plt.close(fig)
 
     except Exception as e:
         print(f"绘图时出错: {e}")
         print(f"可用状态: {result.state_names[:20]}")
 
     # 保存数据
-    result.to_csv('simple_dae_rlc.csv')
-    print(f"✓ 数据已保存: simple_dae_rlc.csv")
+    result.to_npz('simple_dae_rlc.npz')
+    print(f"✓ 数据已保存: simple_dae_rlc.npz")
+
+    if SAVE_CSV:
+        result.to_csv('simple_dae_rlc.csv')
+        print(f"✓ 数据已保存: simple_dae_rlc.csv")
 
 
 if __name__ == "__main__":
@@ -150,7 +150,7 @@ def test_algebraic_probe():
 
         plt.suptitle('Algebraic Variable Probe Test', fontsize=14, fontweight='bold')
         plt.tight_layout()
-        plt.savefig('test_algebraic_probe.png', dpi=300, bbox_inches='tight')
+        plt.savefig('test_algebraic_probe.png', dpi=100, bbox_inches='tight')
         print("[OK] 图形已保存: test_algebraic_probe.png")
         # plt.show()
 
@@ -27,12 +27,9 @@ import sys
 sys.path.insert(0, '.')
 
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 
 from pycontroldae.blocks import (
-    PID, Gain, Sum, Limiter,
+    PID, Gain, Subtract, Add2, Limiter,
     Constant, Step, Sin,
     StateSpace
 )
@@ -125,9 +122,9 @@ print("[3.3] Disturbance: Sinusoidal")
 print("\nPART 4: Building Error Computation Blocks")
 print("-" * 80)
 
-error1 = Sum(name="error1", num_inputs=2, signs=[+1, -1])
-error2 = Sum(name="error2", num_inputs=2, signs=[+1, -1])
-control_sum1 = Sum(name="ctrl_sum1", num_inputs=2, signs=[+1, +1])
+error1 = Subtract(name="error1")
+error2 = Subtract(name="error2")
+control_sum1 = Add2(name="ctrl_sum1")
 
 print("[4.1] Error 1 Summer")
 print("[4.2] Error 2 Summer")
@@ -140,18 +137,14 @@ print("\nPART 5: Building All Modules")
 print("-" * 80)
 
 try:
-    pid1.build()
-    limiter1.build()
-    pid2.build()
-    gain2.build()
-    plant.build()
-    setpoint1.build()
-    setpoint2.build()
-    disturbance.build()
-    error1.build()
-    error2.build()
-    control_sum1.build()
-    print("[SUCCESS] All 11 modules built\n")
+    modules_to_build = [
+        pid1, limiter1, pid2, gain2, plant,
+        setpoint1, setpoint2, disturbance,
+        error1, error2, control_sum1
+    ]
+    for mod in modules_to_build:
+        mod.build()
+    print(f"[SUCCESS] All {len(modules_to_build)} modules built\n")
 except Exception as e:
     print(f"[ERROR] {e}")
     sys.exit(1)
@@ -170,8 +163,7 @@ modules = [
     pid1, limiter1, pid2, gain2, plant
 ]
 
-for mod in modules:
-    system.add_module(mod)
+system.add_modules(modules)
 
 print(f"[6.1] Added {len(system.modules)} modules")
 
@@ -181,25 +173,26 @@ print(f"[6.1] Added {len(system.modules)} modules")
 print("\nPART 7: Defining Connections")
 print("-" * 80)
 
-# Loop 1: SP1 -> Error1 -> PID1 -> Limiter1 -> Sum -> Plant.U1
-#                  ^                                      |
-#                  +----------------- Plant.Y1 -----------+
-system.connect("sp1.signal ~ error1.input1")
-system.connect("plant.y1 ~ error1.input2")
-system.connect("error1.output ~ pid1.error")
-system.connect("pid1.output ~ lim1.input")
-system.connect("lim1.output ~ ctrl_sum1.input1")
-system.connect("dist.signal ~ ctrl_sum1.input2")
-system.connect("ctrl_sum1.output ~ plant.u1")
-
-# Loop 2: SP2 -> Error2 -> PID2 -> Gain2 -> Plant.U2
-#                  ^                          |
-#                  +------- Plant.Y2 ---------+
-system.connect("sp2.signal ~ error2.input1")
-system.connect("plant.y2 ~ error2.input2")
-system.connect("error2.output ~ pid2.error")
-system.connect("pid2.output ~ gain2.input")
-system.connect("gain2.output ~ plant.u2")
+system.connect_many([
+    # Loop 1: SP1 -> Error1 -> PID1 -> Limiter1 -> Sum -> Plant.U1
+    #              ^                                      |
+    #              +----------------- Plant.Y1 -----------+
+    "sp1.signal ~ error1.input1",
+    "plant.y1 ~ error1.input2",
+    "error1.output ~ pid1.error",
+    "pid1.output ~ lim1.input",
+    "lim1.output ~ ctrl_sum1.input1",
+    "dist.signal ~ ctrl_sum1.input2",
+    "ctrl_sum1.output ~ plant.u1",
+    # Loop 2: SP2 -> Error2 -> PID2 -> Gain2 -> Plant.U2
+    #              ^                          |
+    #              +------- Plant.Y2 ---------+
+    "sp2.signal ~ error2.input1",
+    "plant.y2 ~ error2.input2",
+    "error2.output ~ pid2.error",
+    "pid2.output ~ gain2.input",
+    "gain2.output ~ plant.u2",
+])
 
 print(f"[7.1] Defined {len(system.connections)} connections")
 print("[SUCCESS] System topology complete\n")
@@ -238,30 +231,28 @@ print(f"[SUCCESS] {len([e for e in system.events if hasattr(e, 'time')])} time e
 print("\nPART 9: Adding Continuous Events")
 print("-" * 80)
 
-limit_triggered = {"y1": False, "y2": False}
+def make_limiter(index, threshold, message, action_params):
+    """Condition/affect pair for u[index] > threshold; reports only the first trigger."""
+    triggered = False
+
+    def check_high(u, t, integrator):
+        return u[index] - threshold if len(u) > index else -1.0
 
-def check_y1_high(u, t, integrator):
-    # Y1 is the first plant output
-    return u[0] - 8.0 if len(u) > 0 else -1.0
+    def limit(integrator):
+        nonlocal triggered
+        if not triggered:
+            print(f"  [SAFETY] {message}")
+            triggered = True
+        return action_params
 
-def limit_ctrl1(integrator):
-    if not limit_triggered["y1"]:
-        print("  [SAFETY] Y1 > 8.0: Limiting output")
-        limit_triggered["y1"] = True
-    return {"lim1.max_val": 5.0}
+    return check_high, limit
 
+# Y1 is the first plant output
+check_y1_high, limit_ctrl1 = make_limiter(0, 8.0, "Y1 > 8.0: Limiting output", {"lim1.max_val": 5.0})
 system.add_event(when_condition(check_y1_high, limit_ctrl1, direction=1))
 print("[9.1] Continuous Event: Y1 > 8.0 -> Limit Controller1")
 
-def check_y2_high(u, t, integrator):
-    return u[1] - 6.0 if len(u) > 1 else -1.0
-
-def limit_ctrl2(integrator):
-    if not limit_triggered["y2"]:
-        print("  [SAFETY] Y2 > 6.0: Reduce gain")
-        limit_triggered["y2"] = True
-    return {"gain2.K": 0.5}
-
+check_y2_high, limit_ctrl2 = make_limiter(1, 6.0, "Y2 > 6.0: Reduce gain", {"gain2.K": 0.5})
 system.add_event(when_condition(check_y2_high, limit_ctrl2, direction=1))
 print("[9.2] Continuous Event: Y2 > 6.0 -> Reduce Gain2")
 
@@ -287,16 +278,19 @@ except Exception as e:
 # ==============================================================================
 print("\nPART 11: Running Simulation")
 print("-" * 80)
-print("Duration: 0-30s, Solver: Rodas5")
+print("Duration: 0-30s, Solver: auto (Tsit5 <-> Rodas5P)")
 print()
 
 try:
     simulator = Simulator(system)
 
+    # The solver integrates in float64; the trajectory is only used for
+    # plotting and statistics, so hand it back as float32
     times, values = simulator.run(
         t_span=(0.0, 30.0),
         dt=0.05,
-        solver="Rodas5"
+        solver="auto",
+        save_dtype=np.float32
     )
 
     print(f"[SUCCESS] Simulation completed!")
@@ -316,36 +310,67 @@ except Exception as e:
 print("\nPART 12: Results Visualization")
 print("-" * 80)
 
+# Imported only now (non-interactive Agg backend), so the matplotlib import
+# is not paid before the simulation has finished
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+# Per-state statistics, reduced once over the whole trajectory
+means = values.mean(axis=0)
+stds = values.std(axis=0)
+maxabs = np.maximum(values.max(axis=0), -values.min(axis=0))
+
 fig, axes = plt.subplots(3, 2, figsize=(14, 12))
 fig.suptitle('Dual-Loop MIMO Control - All Features Demo', fontsize=16, fontweight='bold')
 
+# Long runs have far more samples than a subplot has pixels; draw line plots
+# and the heatmap from a strided view limited to roughly the figure width in pixels
+target = int(fig.get_size_inches()[0] * fig.dpi)
+stride = len(times) // target if len(times) > 4 * target else 1
+times_ds = times[::stride]
+values_ds = values[::stride]
+
+
+def add_state_lines(ax, n, linewidth, alpha=1.0):
+    """Draw the first n states as one LineCollection; returns legend proxies."""
+    n = min(n, values_ds.shape[1])
+    colors = plt.cm.tab10(np.arange(n) % 10)
+    segments = [np.column_stack([times_ds, values_ds[:, i]]) for i in range(n)]
+    ax.add_collection(LineCollection(segments, colors=colors,
+                                     linewidths=linewidth, alpha=alpha))
+    ax.autoscale_view()
+    return [Line2D([], [], color=colors[i], linewidth=linewidth, alpha=alpha,
+                   label=f'State {i+1}') for i in range(n)]
+
+
 # Plot 1: All states
 ax = axes[0, 0]
-for i in range(min(8, values.shape[1])):
-    ax.plot(times, values[:, i], label=f'State {i+1}', linewidth=1.5, alpha=0.8)
+state_handles = add_state_lines(ax, 8, linewidth=1.5, alpha=0.8)
 ax.axvline(x=2.0, color='r', linestyle='--', alpha=0.3, linewidth=2, label='Step')
 ax.axvline(x=10.0, color='g', linestyle='--', alpha=0.3, linewidth=2, label='Event1')
 ax.axvline(x=20.0, color='b', linestyle='--', alpha=0.3, linewidth=2, label='Event2')
 ax.set_xlabel('Time (s)', fontsize=10)
 ax.set_ylabel('State Values', fontsize=10)
 ax.set_title('System States Evolution', fontweight='bold')
-ax.legend(fontsize=8, ncol=2)
+ax.legend(handles=state_handles + ax.get_lines(), fontsize=8, ncol=2)
 ax.grid(True, alpha=0.3)
 
 # Plot 2: Primary states detail
 ax = axes[0, 1]
-for i in range(min(4, values.shape[1])):
-    ax.plot(times, values[:, i], label=f'State {i+1}', linewidth=2)
+state_handles = add_state_lines(ax, 4, linewidth=2)
 ax.set_xlabel('Time (s)', fontsize=10)
 ax.set_ylabel('State Values', fontsize=10)
 ax.set_title('Primary States (Detail)', fontweight='bold')
-ax.legend(fontsize=9)
+ax.legend(handles=state_handles, fontsize=9)
 ax.grid(True, alpha=0.3)
 
 # Plot 3: Phase portrait
 ax = axes[1, 0]
 if values.shape[1] >= 2:
-    ax.plot(values[:, 0], values[:, 1], linewidth=2, color='purple', alpha=0.7)
+    ax.plot(values_ds[:, 0], values_ds[:, 1], linewidth=2, color='purple', alpha=0.7)
     ax.scatter(values[0, 0], values[0, 1], c='green', s=150, marker='o',
                label='Start', zorder=5, edgecolors='black', linewidths=2)
     ax.scatter(values[-1, 0], values[-1, 1], c='red', s=150, marker='s',
@@ -358,7 +383,11 @@ if values.shape[1] >= 2:
 
 # Plot 4: State heatmap
 ax = axes[1, 1]
-im = ax.imshow(values.T, aspect='auto', cmap='viridis', interpolation='nearest')
+# Contiguous (float32) copy so matplotlib does not transpose on every redraw;
+# the extent keeps the x axis in original time indices
+heatmap = np.ascontiguousarray(values_ds.T, dtype=np.float32)
+im = ax.imshow(heatmap, aspect='auto', cmap='viridis', interpolation='nearest',
+               extent=(-0.5, len(times) - 0.5, heatmap.shape[0] - 0.5, -0.5))
 ax.set_xlabel('Time Index', fontsize=10)
 ax.set_ylabel('State Index', fontsize=10)
 ax.set_title('State Variables Heatmap', fontweight='bold')
@@ -366,10 +395,8 @@ plt.colorbar(im, ax=ax, label='State Value')
 
 # Plot 5: State statistics
 ax = axes[2, 0]
-state_means = np.mean(values, axis=0)
-state_stds = np.std(values, axis=0)
-x_pos = np.arange(len(state_means))
-ax.bar(x_pos, state_means, yerr=state_stds, alpha=0.7, capsize=5, color='steelblue', edgecolor='black')
+x_pos = np.arange(len(means))
+ax.bar(x_pos, means, yerr=stds, alpha=0.7, capsize=5, color='steelblue', edgecolor='black')
 ax.set_xlabel('State Index', fontsize=10)
 ax.set_ylabel('Mean Value', fontsize=10)
 ax.set_title('State Statistics (Mean ± Std)', fontweight='bold')
@@ -388,8 +415,9 @@ ax.set_title('Detailed View: Final 5 seconds', fontweight='bold')
 ax.legend(fontsize=9)
 ax.grid(True, alpha=0.3)
 
-plt.tight_layout()
-plt.savefig('all_features_demo.png', dpi=150, bbox_inches='tight')
+# Fixed margins: tight_layout + bbox_inches='tight' would render the figure twice
+fig.subplots_adjust(left=0.06, right=0.97, top=0.94, bottom=0.05, wspace=0.22, hspace=0.32)
+fig.savefig('all_features_demo.png', dpi=150)
 print("[OK] Saved plot: all_features_demo.png")
 
 # Statistics
@@ -398,10 +426,7 @@ print(f"  States: {values.shape[1]}")
 print(f"  Duration: {times[-1]:.1f}s")
 print(f"  Time steps: {len(times)}")
 for i in range(min(6, values.shape[1])):
-    mean_val = np.mean(values[:, i])
-    std_val = np.std(values[:, i])
-    max_val = np.max(np.abs(values[:, i]))
-    print(f"    State {i+1}: mean={mean_val:.3f}, std={std_val:.3f}, max={max_val:.3f}")
+    print(f"    State {i+1}: mean={means[i]:.3f}, std={stds[i]:.3f}, max={maxabs[i]:.3f}")
 
 print()
 
@@ -423,7 +448,7 @@ print("  [OK] Multiple feedback loops (dual-loop control)")
 print("  [OK] Signal sources (Step, Constant, Sin)")
 print("  [OK] Basic blocks (PID, Gain, Limiter, Sum)")
 print("  [OK] System compilation with structural_simplify")
-print("  [OK] Simulation with Rodas5 solver")
+print("  [OK] Simulation with automatic stiffness switching")
 print("  [OK] Event-driven parameter changes")
 print("  [OK] Feed-forward disturbance path")
 print()
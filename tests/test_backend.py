@@ -8,7 +8,7 @@ ModelingToolkit and DifferentialEquations are properly loaded.
 import sys
 sys.path.insert(0, '.')
 
-from pycontroldae.core.backend import get_jl
+from pycontroldae.core.backend import get_jl, is_defined
 
 print("=" * 60)
 print("Testing pycontroldae Julia Backend")
@@ -27,7 +27,7 @@ except Exception as e:
 # Test 2: Verify ModelingToolkit is loaded
 print("Test 2: Verifying ModelingToolkit.jl is available...")
 try:
-    result = jl.seval("isdefined(Main, :ModelingToolkit)")
+    result = is_defined("ModelingToolkit")
     if result:
         print("[PASS] ModelingToolkit is loaded\n")
     else:
@@ -40,7 +40,7 @@ except Exception as e:
 # Test 3: Verify DifferentialEquations is loaded
 print("Test 3: Verifying DifferentialEquations.jl is available...")
 try:
-    result = jl.seval("isdefined(Main, :DifferentialEquations)")
+    result = is_defined("DifferentialEquations")
     if result:
         print("[PASS] DifferentialEquations is loaded\n")
     else:
@@ -53,8 +53,8 @@ except Exception as e:
 # Test 4: Verify symbolic operators (t, D) are available
 print("Test 4: Verifying symbolic operators (t, D) are available...")
 try:
-    t_defined = jl.seval("isdefined(Main, :t)")
-    D_defined = jl.seval("isdefined(Main, :D)")
+    t_defined = is_defined("t")
+    D_defined = is_defined("D")
     if t_defined and D_defined:
         print("[PASS] Symbolic operators (t, D) are available\n")
     else:
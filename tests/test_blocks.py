@@ -11,7 +11,7 @@ import sys
 sys.path.insert(0, '.')
 
 import numpy as np
-from pycontroldae.blocks import Step, Sin, Ramp, Constant, Gain, Sum, PID
+from pycontroldae.blocks import Step, Sin, Ramp, Constant, Gain, Sum, Subtract, Add2, PID
 from pycontroldae.core import System, Simulator
 
 print("=" * 70)
@@ -109,8 +109,17 @@ try:
     summer = Sum(name="summer", num_inputs=2, signs=[+1, -1])
     summer.build()
 
+    # Two-input shorthands generate the same equations
+    subtractor = Subtract(name="subtractor")
+    adder = Add2(name="adder")
+    assert subtractor._equations == ["D(output) ~ ((input1 - input2) - output) / tau"]
+    assert adder._equations == ["D(output) ~ ((input1 + input2) - output) / tau"]
+    subtractor.build()
+    adder.build()
+
     print(f"[PASS] Sum block created and built")
-    print(f"       {summer}\n")
+    print(f"       {summer}")
+    print(f"       {subtractor}, {adder}\n")
 except Exception as e:
     print(f"[FAIL] {e}\n")
     sys.exit(1)
@@ -645,10 +645,13 @@ print(f"  Number of states: {values.shape[1]}")
 print(f"  Simulation duration: {times[-1]:.1f} seconds")
 print(f"  Time steps: {len(times)}")
 print(f"  Average state magnitudes:")
-for i in range(min(5, values.shape[1])):
-    mean_val = np.mean(np.abs(values[:, i]))
-    max_val = np.max(np.abs(values[:, i]))
-    print(f"    State {i+1}: mean={mean_val:.3f}, max={max_val:.3f}")
+# mean |x| needs one |x| copy of the reported columns; max |x| is
+# taken as max(max, -min) over the original values instead
+head = values[:, :5]
+mean_abs = np.abs(head).mean(axis=0)
+max_abs = np.maximum(head.max(axis=0), -head.min(axis=0))
+for i in range(head.shape[1]):
+    print(f"    State {i+1}: mean={mean_abs[i]:.3f}, max={max_abs[i]:.3f}")
 
 print()
 
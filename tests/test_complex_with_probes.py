@@ -15,10 +15,11 @@ import sys
 sys.path.insert(0, '.')
 
 import numpy as np
-import os
+import tempfile
+from pathlib import Path
 
 from pycontroldae.blocks import (
-    PID, Gain, Limiter, Sum,
+    PID, Gain, Limiter, VectorSum,
     Step, Ramp, Sin,
     StateSpace, Integrator
 )
@@ -214,19 +215,11 @@ flow_sp_B.build()
 print("[4.4] 流量设定值B: 正弦波 A=3.0, f=0.2")
 
 # 误差计算
-temp_error_A = Sum(name="temp_error_A", num_inputs=2, signs=[+1, -1])
-temp_error_A.build()
+# 4路误差放在一个VectorSum模块中: 通道 1..4 = 温度A、流量A、温度B、流量B
+errors = VectorSum(name="errors", n=4, signs=[+1, -1])
+errors.build()
 
-flow_error_A = Sum(name="flow_error_A", num_inputs=2, signs=[+1, -1])
-flow_error_A.build()
-
-temp_error_B = Sum(name="temp_error_B", num_inputs=2, signs=[+1, -1])
-temp_error_B.build()
-
-flow_error_B = Sum(name="flow_error_B", num_inputs=2, signs=[+1, -1])
-flow_error_B.build()
-
-print("[4.5] 创建了 4个误差计算模块")
+print("[4.5] 创建了 4通道误差计算模块")
 
 # 混合信号（扰动）
 disturbance_1 = Sin(name="disturbance_1", amplitude=2.0, frequency=0.3)
@@ -254,7 +247,7 @@ modules = [
     # 参考信号
     temp_sp_A, flow_sp_A, temp_sp_B, flow_sp_B,
     # 误差计算
-    temp_error_A, flow_error_A, temp_error_B, flow_error_B,
+    errors,
     # 控制站（嵌套CompositeModule）
     station_A, station_B,
     # 混合站
@@ -265,8 +258,7 @@ modules = [
     process_plant
 ]
 
-for mod in modules:
-    system.add_module(mod)
+system.add_modules(modules)
 
 print(f"[5.1] 添加了 {len(system.modules)} 个模块")
 print(f"      其中:")
@@ -280,42 +272,36 @@ print(f"        - 其他普通模块")
 print("\n\nPART 6: 定义连接")
 print("-" * 80)
 
-# 设定值 >> 误差计算
-system.connect("temp_sp_A.signal ~ temp_error_A.input1")
-system.connect("flow_sp_A.signal ~ flow_error_A.input1")
-system.connect("temp_sp_B.signal ~ temp_error_B.input1")
-system.connect("flow_sp_B.signal ~ flow_error_B.input1")
+system.connect_many([
+    # 设定值 >> 误差计算
+    "temp_sp_A.signal ~ errors.input1_1",
+    "flow_sp_A.signal ~ errors.input1_2",
+    "temp_sp_B.signal ~ errors.input1_3",
+    "flow_sp_B.signal ~ errors.input1_4",
+    # 过程输出 >> 误差计算（反馈）
+    "process.y1 ~ errors.input2_1",
+    "process.y2 ~ errors.input2_2",
+    "process.y3 ~ errors.input2_3",
+    "process.y4 ~ errors.input2_4",
+    # 误差 >> 控制站
+    "errors.output1 ~ station_A.temp_error",
+    "errors.output2 ~ station_A.flow_error",
+    "errors.output3 ~ station_B.temp_error",
+    "errors.output4 ~ station_B.flow_error",
+    # 控制站 >> 过程
+    "station_A.heating ~ process.u1",
+    "station_A.valve ~ process.u2",
+    "station_B.heating ~ process.u3",
+    "station_B.valve ~ process.u4",
+    # 扰动 >> 混合站
+    "disturbance_1.signal ~ mixer_1.flow_in",
+    "disturbance_2.signal ~ mixer_2.flow_in",
+])
 
 print("[6.1] 设定值 >> 误差计算")
-
-# 过程输出 >> 误差计算（反馈）
-system.connect("process.y1 ~ temp_error_A.input2")
-system.connect("process.y2 ~ flow_error_A.input2")
-system.connect("process.y3 ~ temp_error_B.input2")
-system.connect("process.y4 ~ flow_error_B.input2")
-
 print("[6.2] 过程输出 >> 误差计算（反馈）")
-
-# 误差 >> 控制站
-system.connect("temp_error_A.output ~ station_A.temp_error")
-system.connect("flow_error_A.output ~ station_A.flow_error")
-system.connect("temp_error_B.output ~ station_B.temp_error")
-system.connect("flow_error_B.output ~ station_B.flow_error")
-
 print("[6.3] 误差 >> 控制站")
-
-# 控制站 >> 过程
-system.connect("station_A.heating ~ process.u1")
-system.connect("station_A.valve ~ process.u2")
-system.connect("station_B.heating ~ process.u3")
-system.connect("station_B.valve ~ process.u4")
-
 print("[6.4] 控制站 >> 过程")
-
-# 扰动 >> 混合站
-system.connect("disturbance_1.signal ~ mixer_1.flow_in")
-system.connect("disturbance_2.signal ~ mixer_2.flow_in")
-
 print("[6.5] 扰动 >> 混合站")
 
 print(f"\n[SUCCESS] 定义了 {len(system.connections)} 个连接\n")
@@ -522,26 +508,21 @@ except ImportError as e:
 # 10.4 to_csv() 全量导出
 print("\n[10.4] to_csv() - CSV文件导出（全量数据）")
 try:
-    csv_filename = "complex_system_full.csv"
-    result.to_csv(csv_filename, include_probes=True)
+    # 临时目录退出时统一清理
+    with tempfile.TemporaryDirectory() as tmpdir:
+        csv_path = Path(tmpdir) / "complex_system_full.csv"
+        result.to_csv(csv_path, include_probes=True)
 
-    if os.path.exists(csv_filename):
-        file_size = os.path.getsize(csv_filename)
-        print(f"       [OK] 已保存: {csv_filename}")
+        file_size = csv_path.stat().st_size
+        print(f"       [OK] 已保存: {csv_path.name}")
         print(f"       文件大小: {file_size} bytes")
 
-        # 读取并验证列数
-        import csv
-        with open(csv_filename, 'r') as f:
-            reader = csv.reader(f)
-            header = next(reader)
+        # 读取并验证列数（只需要表头一行）
+        with open(csv_path, 'r') as f:
+            header = f.readline().rstrip("\n").split(",")
         print(f"       列数: {len(header)}")
         print(f"       前10列: {header[:10]}")
-
-    # 清理文件
-    if os.path.exists(csv_filename):
-        os.remove(csv_filename)
-        print(f"       [OK] 已清理测试文件")
+    print(f"       [OK] 已清理测试文件")
 except ImportError as e:
     print(f"       [SKIPPED] {e}")
 
@@ -564,18 +545,13 @@ except ImportError as e:
 print("\n[10.6] save_probe_csv() - 分别保存每个探测器")
 try:
     saved_files = []
-    for probe_name in result.probe_data.keys():
-        filename = f"probe_{probe_name}.csv"
-        result.save_probe_csv(probe_name, filename)
-        if os.path.exists(filename):
-            file_size = os.path.getsize(filename)
-            print(f"       [OK] {probe_name}: {filename} ({file_size} bytes)")
-            saved_files.append(filename)
-
-    # 清理文件
-    for filename in saved_files:
-        if os.path.exists(filename):
-            os.remove(filename)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for probe_name in result.probe_data.keys():
+            path = Path(tmpdir) / f"probe_{probe_name}.csv"
+            result.save_probe_csv(probe_name, path)
+            file_size = path.stat().st_size
+            print(f"       [OK] {probe_name}: {path.name} ({file_size} bytes)")
+            saved_files.append(path.name)
     print(f"       [OK] 已清理 {len(saved_files)} 个测试文件")
 except ImportError as e:
     print(f"       [SKIPPED] {e}")
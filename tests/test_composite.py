@@ -267,6 +267,36 @@ except Exception as e:
     import traceback
     traceback.print_exc()
 
+# ==============================================================================
+# Test 8: Interfaces are part of the compile cache key
+# ==============================================================================
+print("Test 8: Composites differing only in interfaces get distinct cache keys...")
+print("-" * 70)
+
+try:
+    def make_system(output_path):
+        comp = CompositeModule(name="chain")
+        comp.add_module(Gain(name="g1", K=2.0))
+        comp.add_module(Gain(name="g2", K=3.0))
+        comp.add_connection("g1.output ~ g2.input")
+        comp.expose_input("inp", "g1.input")
+        comp.expose_output("out", output_path)
+        sys_chain = System("interface_key_test")
+        sys_chain.add_module(comp)
+        return sys_chain
+
+    key_g2 = make_system("g2.output")._structure_key()
+    key_g1 = make_system("g1.output")._structure_key()
+    assert key_g2 != key_g1, "expose_output() target must change the structure key"
+    assert key_g2 == make_system("g2.output")._structure_key()
+
+    print(f"[PASS] Structure keys differ: {key_g2[:8]}... vs {key_g1[:8]}...\n")
+
+except Exception as e:
+    print(f"[FAIL] {e}\n")
+    import traceback
+    traceback.print_exc()
+
 # ==============================================================================
 # Summary
 # ==============================================================================
@@ -284,6 +314,7 @@ print("  [OK] Nested composites (hierarchy)")
 print("  [OK] Multi-input multi-output composites")
 print("  [OK] Integration with System class")
 print("  [OK] Connection operators (>> and <<)")
+print("  [OK] Exposed interfaces in the compile cache key")
 print()
 print("Key Capabilities:")
 print("  - Encapsulate multiple modules into one")
@@ -18,6 +18,9 @@ print("Testing Continuous Events (ContinuousCallback)")
 print("=" * 70)
 print()
 
+# One figure is reused by every test: each plot clears the axes and redraws
+fig, ax = plt.subplots(figsize=(10, 6))
+
 # ==============================================================================
 # Test 1: Trigger when state crosses threshold
 # ==============================================================================
@@ -35,11 +38,10 @@ try:
     sys1.connect(input_src >> integrator)
 
     # Event: When integrator output crosses 5.0, reduce input
-    def check_threshold(u, t, integrator):
-        # u[2] should be the integrator output (third state)
-        # We need to find the right index
-        # For safety, let's return based on the last state
-        return u[-1] - 5.0
+    # The condition is evaluated by the solver at every step, so it is given as
+    # a Julia expression (compiled natively; u[end] is the last state, the
+    # integrator output) instead of a Python function
+    check_threshold = "u[end] - 5.0"
 
     def reduce_input(integrator):
         print(f"  [EVENT] Threshold crossed! Reducing input from 2.0 to 0.5")
@@ -62,15 +64,15 @@ try:
     print()
 
     # Plot results
-    plt.figure(figsize=(10, 6))
-    plt.plot(times, values[:, -1], 'b-', linewidth=2, label='Integrator Output')
-    plt.axhline(y=5.0, color='r', linestyle='--', label='Threshold = 5.0')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Output')
-    plt.title('Test 1: Threshold Detection (Output Crosses 5.0)')
-    plt.legend()
-    plt.grid(True)
-    plt.savefig('test_continuous_event_1.png')
+    ax.clear()
+    ax.plot(times, values[:, -1], 'b-', linewidth=2, label='Integrator Output')
+    ax.axhline(y=5.0, color='r', linestyle='--', label='Threshold = 5.0')
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Output')
+    ax.set_title('Test 1: Threshold Detection (Output Crosses 5.0)')
+    ax.legend()
+    ax.grid(True)
+    fig.savefig('test_continuous_event_1.png')
     print(f"  Plot saved to test_continuous_event_1.png")
 
 except Exception as e:
@@ -100,39 +102,58 @@ try:
     # Event: Detect when sine crosses 1.0 (in both directions)
     crossing_count = [0]  # Use list to allow modification in closure
 
-    def check_sine_threshold(u, t, integrator):
-        # Check if sine output crosses 1.0
-        return u[0] - 1.0  # First state is the sine signal
-
     def on_crossing(integrator):
         crossing_count[0] += 1
         print(f"  [EVENT] Crossing #{crossing_count[0]} detected!")
         return {}  # No parameter changes
 
+    # Native condition (evaluated in Julia by the root finder): the first
+    # state is the sine signal
     sys2.add_event(when_condition(
-        check_sine_threshold,
+        "u[1] - 1.0",
         on_crossing,
         direction=0  # Both directions
     ))
 
+    # Same threshold with one direction each: every crossing fires exactly one
+    up_count = [0]
+    down_count = [0]
+
+    def on_up(integrator):
+        up_count[0] += 1
+
+    def on_down(integrator):
+        down_count[0] += 1
+
+    sys2.add_event(when_condition("u[1] - 1.0", on_up, direction=1))
+    sys2.add_event(when_condition("u[1] - 1.0", on_down, direction=-1))
+
     # Compile and simulate
     sys2.compile()
     sim2 = Simulator(sys2)
     times2, values2 = sim2.run(t_span=(0.0, 5.0), dt=0.02)
 
+    assert up_count[0] > 0 and down_count[0] > 0, "expected crossings in both directions"
+    assert up_count[0] + down_count[0] == crossing_count[0], (
+        f"up ({up_count[0]}) + down ({down_count[0]}) crossings != "
+        f"bidirectional count ({crossing_count[0]})"
+    )
+    assert abs(up_count[0] - down_count[0]) <= 1, "up/down crossings must alternate"
+
     print(f"[PASS] Bidirectional event detection completed")
-    print(f"       Total crossings detected: {crossing_count[0]}\n")
+    print(f"       Total crossings detected: {crossing_count[0]} "
+          f"(up: {up_count[0]}, down: {down_count[0]})\n")
 
     # Plot results
-    plt.figure(figsize=(10, 6))
-    plt.plot(times2, values2[:, 0], 'b-', linewidth=2, label='Sine Wave')
-    plt.axhline(y=1.0, color='r', linestyle='--', label='Threshold = 1.0')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Signal')
-    plt.title('Test 2: Bidirectional Zero-Crossing Detection')
-    plt.legend()
-    plt.grid(True)
-    plt.savefig('test_continuous_event_2.png')
+    ax.clear()
+    ax.plot(times2, values2[:, 0], 'b-', linewidth=2, label='Sine Wave')
+    ax.axhline(y=1.0, color='r', linestyle='--', label='Threshold = 1.0')
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Signal')
+    ax.set_title('Test 2: Bidirectional Zero-Crossing Detection')
+    ax.legend()
+    ax.grid(True)
+    fig.savefig('test_continuous_event_2.png')
     print(f"  Plot saved to test_continuous_event_2.png")
 
 except Exception as e:
@@ -163,30 +184,25 @@ try:
     sys3.connect("control_input.signal ~ controller.input")
     sys3.connect("controller.output ~ process.input")
 
-    # Event 1: When process output reaches 8.0, switch to low gain
-    def check_upper_limit(u, t, integrator):
-        return u[-1] - 8.0  # Process output
-
+    # Event 1: When process output (last state) reaches 8.0, switch to low gain
     def switch_to_low_gain(integrator):
         print(f"  [EVENT] Upper limit reached! Switching to low gain (0.5)")
         return {"controller.K": 0.5}
 
     # Event 2: When process output falls to 6.0, switch back to high gain
-    def check_lower_limit(u, t, integrator):
-        return u[-1] - 6.0
-
     def switch_to_high_gain(integrator):
         print(f"  [EVENT] Lower limit reached! Switching to high gain (2.0)")
         return {"controller.K": 2.0}
 
+    # Conditions are native Julia expressions; only the affects call Python
     sys3.add_event(when_condition(
-        check_upper_limit,
+        "u[end] - 8.0",
         switch_to_low_gain,
         direction=1  # Only upward crossing
     ))
 
     sys3.add_event(when_condition(
-        check_lower_limit,
+        "u[end] - 6.0",
         switch_to_high_gain,
         direction=-1  # Only downward crossing
     ))
@@ -200,17 +216,17 @@ try:
     print(f"       System maintained output between limits\n")
 
     # Plot results
-    plt.figure(figsize=(10, 6))
-    plt.plot(times3, values3[:, -1], 'b-', linewidth=2, label='Process Output')
-    plt.axhline(y=8.0, color='r', linestyle='--', alpha=0.7, label='Upper Limit')
-    plt.axhline(y=6.0, color='g', linestyle='--', alpha=0.7, label='Lower Limit')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Output')
-    plt.title('Test 3: Hysteresis Control with Continuous Events')
-    plt.legend()
-    plt.grid(True)
-    plt.ylim([5, 9])
-    plt.savefig('test_continuous_event_3.png')
+    ax.clear()
+    ax.plot(times3, values3[:, -1], 'b-', linewidth=2, label='Process Output')
+    ax.axhline(y=8.0, color='r', linestyle='--', alpha=0.7, label='Upper Limit')
+    ax.axhline(y=6.0, color='g', linestyle='--', alpha=0.7, label='Lower Limit')
+    ax.set_xlabel('Time (s)')
+    ax.set_ylabel('Output')
+    ax.set_title('Test 3: Hysteresis Control with Continuous Events')
+    ax.legend()
+    ax.grid(True)
+    ax.set_ylim([5, 9])
+    fig.savefig('test_continuous_event_3.png')
     print(f"  Plot saved to test_continuous_event_3.png")
 
 except Exception as e:
@@ -219,6 +235,72 @@ except Exception as e:
     traceback.print_exc()
     sys.exit(1)
 
+# ==============================================================================
+# Test 4: Fully native event (string condition + fixed parameter changes)
+# ==============================================================================
+print("\nTest 4: Native Julia event without Python callbacks...")
+print("-" * 70)
+
+try:
+    input_src4 = Constant(name="input", value=2.0)
+    input_src4.set_output("signal")
+
+    integrator4 = Integrator(name="int", initial_value=0.0)
+
+    sys4 = System("native_event_test")
+    sys4.connect(input_src4 >> integrator4)
+
+    # Same threshold as Test 1, expressed without any Python function
+    sys4.add_event(when_condition("int.output - 5.0", {"input.value": 0.5}, direction=1))
+
+    sys4.compile()
+    sim4 = Simulator(sys4)
+    times4, values4 = sim4.run(t_span=(0.0, 6.0), dt=0.05)
+
+    # Before the crossing the slope is 2.0, afterwards 0.5
+    final_expected = 5.0 + 0.5 * (6.0 - 2.5)
+    tol = 0.05
+    assert abs(values4[-1, -1] - final_expected) < tol, (
+        f"final output {values4[-1, -1]:.3f} differs from expected {final_expected:.3f}"
+    )
+    print(f"[PASS] Native event simulation completed")
+    print(f"       Final output: {values4[-1, -1]:.3f} (expected ~{final_expected:.3f})\n")
+
+except Exception as e:
+    print(f"[FAIL] {e}\n")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
+
+# ==============================================================================
+# Test 5: Batch of scenarios whose events fire at different times
+# ==============================================================================
+print("\nTest 5: run_batch with a continuous event...")
+print("-" * 70)
+
+try:
+    # Test 4's system: with input 2.0 the event fires at t=2.5, with input 0.5
+    # the output never reaches 5.0, so the scenarios fire different event counts
+    times5, values5 = sim4.run_batch(
+        t_span=(0.0, 6.0),
+        param_sets=[{"input.value": 2.0}, {"input.value": 0.5}],
+        dt=0.05
+    )
+
+    assert values5.shape[:2] == (2, len(times5)), f"unexpected shape {values5.shape}"
+    assert len(times5) == 121, f"expected the 121-point dt grid, got {len(times5)}"
+    assert abs(values5[0, -1, -1] - final_expected) < tol
+    assert abs(values5[1, -1, -1] - 0.5 * 6.0) < tol
+
+    print(f"[PASS] Batch with events completed")
+    print(f"       Final outputs: {values5[0, -1, -1]:.3f}, {values5[1, -1, -1]:.3f}\n")
+
+except Exception as e:
+    print(f"[FAIL] {e}\n")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)
+
 # ==============================================================================
 # Summary
 # ==============================================================================
@@ -231,6 +313,8 @@ print("  [OK] Zero-crossing detection (upward)")
 print("  [OK] Bidirectional crossing detection")
 print("  [OK] State-dependent control switching")
 print("  [OK] Multiple continuous events on same system")
+print("  [OK] Native Julia condition and parameter changes")
+print("  [OK] Parameter batches with events on one time grid")
 print()
 print("Implementation Details:")
 print("  - ContinuousEvent uses condition functions")
@@ -15,11 +15,12 @@ Test Data Probes and Export Functions
 import sys
 sys.path.insert(0, '.')
 
+import gzip
 import numpy as np
 import os
 
 from pycontroldae.blocks import PID, Gain, Sum, Step, StateSpace
-from pycontroldae.core import System, Simulator, DataProbe
+from pycontroldae.core import System, Simulator, DataProbe, SimulationResult
 
 print("=" * 80)
 print("数据探测器和导出功能测试")
@@ -280,6 +281,31 @@ try:
         print(f"      前3行:")
         for line in lines:
             print(f"        {line.strip()}")
+
+        # 快速路径的输出必须与pandas的DataFrame.to_csv()一致
+        expected_csv = result1.to_dataframe(include_probes=True).to_csv(index=False)
+        with open(csv_file1, 'r') as f:
+            assert f.read().splitlines() == expected_csv.splitlines(), \
+                "to_csv() 输出与 DataFrame.to_csv() 不一致"
+        print(f"      [OK] 与 DataFrame.to_csv() 输出一致")
+
+        # 压缩文件名交给pandas处理（按后缀推断压缩格式）
+        result1.to_csv("test_probe_data.csv.gz", include_probes=True)
+        with gzip.open("test_probe_data.csv.gz", 'rt') as f:
+            assert f.read().splitlines() == expected_csv.splitlines(), \
+                "to_csv() 的 .gz 输出与 DataFrame.to_csv() 不一致"
+        print(f"      [OK] .gz 文件已压缩，内容一致")
+
+        # NaN 与 pandas 一样写成空字段
+        nan_result = SimulationResult(
+            np.array([0.0, 0.1]), np.array([[1.0, np.nan], [0.5, 2.0]]), ["a.x", "b.x"]
+        )
+        nan_result.to_csv("test_probe_nan.csv")
+        with open("test_probe_nan.csv", 'r') as f:
+            assert f.read().splitlines() == \
+                nan_result.to_dataframe().to_csv(index=False).splitlines(), \
+                "含NaN的 to_csv() 输出与 DataFrame.to_csv() 不一致"
+        print(f"      [OK] NaN 输出与 DataFrame.to_csv() 一致")
     else:
         print(f"      [ERROR] 文件未创建")
 except ImportError as e:
@@ -404,6 +430,15 @@ try:
 except ImportError as e:
     print(f"      [SKIPPED] pandas未安装: {e}")
 
+# 6.3 get_probe_array() - 单个探测器的二维数组
+print("\n[6.3] get_probe_array() - 探测器二维数组")
+control_arr = result3.get_probe_array("control_signals")
+control_names = list(result3.probe_data["control_signals"])
+assert control_arr.shape == (len(result3.times), len(control_names))
+for i, name in enumerate(control_names):
+    assert np.array_equal(control_arr[:, i], result3.probe_data["control_signals"][name])
+print(f"      control_signals: {control_arr.shape}, 与probe_data一致")
+
 # ==============================================================================
 # Part 7: 时间切片和统计摘要
 # ==============================================================================
@@ -495,15 +530,24 @@ print("-" * 80)
 
 test_files = [
     "test_probe_data.csv",
+    "test_probe_data.csv.gz",
+    "test_probe_nan.csv",
     "test_probe_0.csv",
     "test_probe_1.csv",
     "test_probe_2.csv"
 ]
 
+def _unlink_quiet(path):
+    """删除文件；文件不存在时返回False（一次unlink，无需先stat）"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    return True
+
 print("[10.1] 清理生成的CSV文件:")
 for filename in test_files:
-    if os.path.exists(filename):
-        os.remove(filename)
+    if _unlink_quiet(filename):
         print(f"      [OK] 已删除: {filename}")
     else:
         print(f"      [SKIP] 不存在: {filename}")
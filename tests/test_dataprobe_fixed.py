@@ -159,7 +159,7 @@ def test_dataprobe_with_dae():
 
         plt.suptitle('DataProbe测试结果 - 修复后', fontsize=14, fontweight='bold')
         plt.tight_layout()
-        plt.savefig('dataprobe_test_fixed.png', dpi=300, bbox_inches='tight')
+        plt.savefig('dataprobe_test_fixed.png', dpi=100, bbox_inches='tight')
         print("✓ 图形已保存: dataprobe_test_fixed.png")
         plt.show()
 
@@ -417,10 +417,13 @@ print("\nStatistical Summary:")
 print(f"  States: {values.shape[1]}")
 print(f"  Duration: {times[-1]:.1f}s")
 print(f"  Time steps: {len(times)}")
-for i in range(min(6, values.shape[1])):
-    mean_val = np.mean(np.abs(values[:, i]))
-    max_val = np.max(np.abs(values[:, i]))
-    print(f"    State {i+1}: mean={mean_val:.3f}, max={max_val:.3f}")
+# mean |x| needs one |x| copy of the reported columns; max |x| is
+# taken as max(max, -min) over the original values instead
+head = values[:, :6]
+mean_abs = np.abs(head).mean(axis=0)
+max_abs = np.maximum(head.max(axis=0), -head.min(axis=0))
+for i in range(head.shape[1]):
+    print(f"    State {i+1}: mean={mean_abs[i]:.3f}, max={max_abs[i]:.3f}")
 
 print()
 